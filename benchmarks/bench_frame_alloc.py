@@ -0,0 +1,117 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+# Memory and time per outbound publish frame, measured with tracemalloc.
+#
+# "dict" replays the 17-key dict that updatedBNewtworkSC used to build and
+# the 16-tuple send() then copied out of it; "frame" is util.NewFrameSC,
+# which builds the dBFrame.frame tuple once in wire order.
+#
+#     python benchmarks/bench_frame_alloc.py --frames 100000
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from databridges_sio_server_lib.commonUtils import util
+from databridges_sio_server_lib.messageTypes import dBTypes
+
+
+def legacy(dbmsgtype, channelName, sid, channelToken, subject=None, source_id=None, t1=None, seqnum=None):
+    msgDbp = {"eventname": "db",
+              "dbmsgtype": dbmsgtype.value,
+              "subject": subject,
+              "rsub": None,
+              "sid": sid,
+              "payload": util.EncodePayload(channelToken),
+              "fenceid": channelName,
+              "rspend": None,
+              "rtrack": None,
+              "rtrackstat": None,
+              "t1": t1,
+              "latency": None,
+              "globmatch": 0,
+              "sourceid": source_id,
+              "sourceip": None,
+              "replylatency": None,
+              "oqueumonitorid": seqnum}
+    return (msgDbp["dbmsgtype"], msgDbp["subject"], msgDbp["rsub"], msgDbp["sid"], msgDbp["payload"],
+            msgDbp["fenceid"], msgDbp["rspend"], msgDbp["rtrack"], msgDbp["rtrackstat"], msgDbp["t1"],
+            msgDbp["latency"], msgDbp["globmatch"], msgDbp["sourceid"], msgDbp["sourceip"], msgDbp["replylatency"],
+            msgDbp["oqueumonitorid"])
+
+
+def framed(dbmsgtype, channelName, sid, channelToken, subject=None, source_id=None, t1=None, seqnum=None):
+    return util.NewFrameSC(dbmsgtype, channelName, sid, channelToken, subject, source_id, t1, seqnum)
+
+
+def build(builder, sid):
+    return builder(dBTypes.messageType.PUBLISH_TO_CHANNEL, "pvt:bench", sid, "payload", "event", "src", None, sid)
+
+
+def peak(builder, frames):
+    total = 0
+    for sid in range(frames):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        build(builder, sid)
+        total += tracemalloc.get_traced_memory()[1] - base
+    return total / frames
+
+
+def retained(builder, frames):
+    base = tracemalloc.get_traced_memory()[0]
+    held = [build(builder, sid) for sid in range(frames)]
+    size = tracemalloc.get_traced_memory()[0] - base
+    del held
+    return size / frames
+
+
+def elapsed(builder, frames):
+    start = time.perf_counter()
+    for sid in range(frames):
+        build(builder, sid)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main(frames):
+    print("%-8s %14s %18s %12s" % ("builder", "peak B/frame", "retained B/frame", "us/frame"))
+    for name, builder in (("dict", legacy), ("frame", framed)):
+        duration = elapsed(builder, frames)
+        tracemalloc.start()
+        try:
+            high = peak(builder, frames)
+            kept = retained(builder, frames)
+        finally:
+            tracemalloc.stop()
+        print("%-8s %14.1f %18.1f %12.3f" % (name, high, kept, duration))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.frames)
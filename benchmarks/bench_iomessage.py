@@ -0,0 +1,116 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+# Per-frame cost of routing an inbound frame through dBridges.__IOMessage.
+#
+# "table" is the per-type handler dict the library uses; "chain" replays the
+# row of independent `if dbmsgtype == dBTypes.messageType.X.value` checks it
+# replaced, with empty bodies, so the difference is the routing overhead
+# alone.
+#
+#     python benchmarks/bench_iomessage.py --frames 200000
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from databridges_sio_server_lib import dBridges
+from databridges_sio_server_lib.messageTypes import dBTypes
+
+
+async def chain(dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+    if dbmsgtype == dBTypes.messageType.SYSTEM_MSG.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.SERVER_SUBSCRIBE_TO_CHANNEL.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.SERVER_UNSUBSCRIBE_DISCONNECT_FROM_CHANNEL.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.PUBLISH_TO_CHANNEL.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.PARTICIPANT_JOIN.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.PARTICIPANT_LEFT.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.CF_CALL_RECEIVED.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.CF_CALL_RESPONSE.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.CF_RESPONSE_TRACKER.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.CF_CALLEE_QUEUE_EXCEEDED.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.CONNECT_TO_RPC_SERVER.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.RPC_CALL_RECEIVED.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.RPC_CALL_RESPONSE.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.RPC_RESPONSE_TRACKER.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.RPC_CALLEE_QUEUE_EXCEEDED.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.REGISTER_RPC_SERVER.value:
+        pass
+    if dbmsgtype == dBTypes.messageType.UNREGISTER_RPC_SERVER.value:
+        pass
+
+
+async def empty(*args):
+    pass
+
+
+async def run(target, dbmsgtype, frames):
+    args = (dbmsgtype, "bench", None, "1", b"x", None, None, None, None, 0, None, None, "src", "ip", None, None)
+    start = time.perf_counter()
+    for _ in range(frames):
+        await target(*args)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+async def main(frames, repeat):
+    db = dBridges()
+    table = db._dBridges__IOMessage
+    publish = dBTypes.messageType.PUBLISH_TO_CHANNEL.value
+    cases = [
+        ("call overhead", empty, publish),
+        ("chain, publish", chain, publish),
+        ("table, publish", table, publish),
+        ("chain, unrouted", chain, -1),
+        ("table, unrouted", table, -1),
+    ]
+    print("%-18s %12s" % ("case", "us/frame"))
+    for name, target, dbmsgtype in cases:
+        best = min([await run(target, dbmsgtype, frames) for _ in range(repeat)])
+        print("%-18s %12.3f" % (name, best))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.frames, args.repeat))
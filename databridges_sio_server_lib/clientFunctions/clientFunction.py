@@ -21,23 +21,24 @@
 
 import asyncio
 
-from ..commonUtils import aioPromise, util, aioTimer
+from ..commonUtils import aioPromise, aioStream, util
 from ..dispatchers import dispatcher
 from ..exceptions import dBError
 from ..messageTypes import dBTypes
 from ..responseHandler import cfrpcResponse
 from ..events import dBEvents
 import json
-import random
+import time
 
 
 class cfclient:
     def __init__(self, dBCoreObject):
-        self.__dispatch = dispatcher.dispatcher();
+        self.__dispatch = dispatcher.dispatcher(dBCoreObject);
         self.__dbcore = dBCoreObject;
         self.enable = False;
         self.functions = None;
         self.__sid_functionname={}
+        self.__sid_pending = {}
         self.__callerTYPE = "cf"
         self.__functionNames = ['cf.response.tracker', 'cf.callee.queue.exceeded']
 
@@ -107,135 +108,112 @@ class cfclient:
         await self.__dispatch.emit_cf('cf.callee.queue.exceeded', err, None);
 
     async def handle_callResponse(self, sid, payload, isend, rsub):
-        if sid in self.__sid_functionname:
-            metadate = {"functionName": self.__sid_functionname[sid]};
-            await self.__dispatch.emit_clientfunction2(sid, payload, isend,rsub)
-
-    def GetUniqueSid(self, sid):
-        nsid = sid + util.GenerateUniqueId();
-        if nsid in self.__sid_functionname:
-            nsid = ("" + str(random.randint(0, 999999)))
-        return nsid
+        if sid not in self.__sid_pending:
+            return
 
-    async def __call_internal(self, sessionid , functionName ,  inparameter, sid, progress_callback):
-        async def internal_call(resolve,reject):
-            interal_result = False
-            cstatus = None;
-            if self.__callerTYPE== 'rpc':
-                cstatus = await util.updatedBNewtworkCF(self.__dbcore, dBTypes.messageType.CALL_RPC_FUNCTION, sessionid, functionName , None , sid ,  inparameter );
-            else:
-                cstatus = await util.updatedBNewtworkCF(self.__dbcore , dBTypes.messageType.CF_CALL, sessionid, functionName , None,  sid ,  inparameter, None, None );
+        if not isend:
+            progress_callback = self.__sid_pending[sid]["progress"]
+            if progress_callback and callable(progress_callback):
+                if asyncio.iscoroutinefunction(progress_callback):
+                    await progress_callback(payload)
+                else:
+                    progress_callback(payload)
+            return
 
-            if not cstatus:
+        dberror = None
+        if rsub is not None:
+            ursub = str(rsub).upper()
+            if ursub == "EXP":
+                eobject = json.loads(payload)
                 if self.__callerTYPE == 'rpc':
-                    reject( dBError.dBError("E079"))
+                    dberror = dBError.dBError("E055")
                 else:
-                    reject(dBError.dBError("E068"))
-
-            async def internal_response(response , rspend, rsub):
-                nonlocal interal_result
-                dberror = None
-                if not rspend:
-                    if progress_callback and callable(progress_callback):
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback(response);
-                        else:
-                            progress_callback(response);
+                    dberror = dBError.dBError("E071")
+                dberror.updateCode(eobject["c"], eobject["m"])
+            else:
+                if self.__callerTYPE == 'rpc':
+                    dberror = dBError.dBError("E054")
                 else:
-                    if rsub is not None:
-                        ursub =  str(rsub).upper()
-                        if ursub == "EXP":
-                            eobject = json.loads(response)
-                            if self.__callerTYPE == 'rpc':
-                                dberror = dBError.dBError("E055")
-                                dberror.updateCode(eobject["c"], eobject["m"] )
-                                reject(dberror)
-                                interal_result = True
-                            else:
-                                dberror = dBError.dBError("E071");
-                                dberror.updateCode(eobject["c"], eobject["m"] );
-                                reject(dberror)
-                                interal_result = True
-                        else:
-                            if self.__callerTYPE == 'rpc':
-                                dberror = dBError.dBError("E054")
-                                dberror.updateCode(ursub, "" )
-                                reject(dberror)
-                                interal_result = True
-                            else:
-                                dberror = dBError.dBError("E070")
-                                dberror.updateCode(ursub , "")
-                                reject(dberror)
-                                interal_result = True
-                    else:
-                        resolve(response)
-                        interal_result = True
-                    self.__dispatch.unbind(sid , None)
-                    del self.__sid_functionname[sid]
-            self.__dispatch.bind(sid ,  internal_response)
-            while not interal_result:
-                await asyncio.sleep(1)
-
-        p = aioPromise.Promise()
-        await p.Execute(internal_call)
-        return p
+                    dberror = dBError.dBError("E070")
+                dberror.updateCode(ursub, "")
+        self.__complete_call(sid, payload, dberror)
 
+    def __complete_call(self, sid, result, dberror=None):
+        if sid not in self.__sid_pending:
+            return
+        call_result = self.__sid_pending.pop(sid)["future"]
+        if sid in self.__sid_functionname:
+            del self.__sid_functionname[sid]
+        if call_result.done():
+            return
+        if dberror is not None:
+            call_result.set_exception(dberror)
+        else:
+            call_result.set_result(result)
 
+    async def __call_internal(self, sessionid , functionName ,  inparameter, sid, progress_callback):
+        call_result = asyncio.get_event_loop().create_future()
+        self.__sid_pending[sid] = {"future": call_result, "progress": progress_callback}
 
-    async def call(self, sessionid, functionName ,  inparameter ,  ttlms , progress_callback):
-        loop_index = 0
-        loop_counter = 3
-        mflag = False
-        sid_created = True
+        cstatus = None;
+        if self.__callerTYPE== 'rpc':
+            cstatus = await util.updatedBNewtworkCF(self.__dbcore, dBTypes.messageType.CALL_RPC_FUNCTION, sessionid, functionName , None , sid ,  inparameter );
+        else:
+            cstatus = await util.updatedBNewtworkCF(self.__dbcore , dBTypes.messageType.CF_CALL, sessionid, functionName , None,  sid ,  inparameter, None, None );
 
-        sid = util.GenerateUniqueId()
-        while loop_index < loop_counter and not mflag:
-            if sid in self.__sid_functionname:
-                sid = self.GetUniqueSid(sid)
-                loop_index = loop_index + 1
+        if not cstatus:
+            if self.__callerTYPE == 'rpc':
+                self.__complete_call(sid, None, dBError.dBError("E079"))
             else:
-                self.__sid_functionname[sid] = functionName
-                mflag = True
+                self.__complete_call(sid, None, dBError.dBError("E068"))
 
-        if not mflag:
-            sid = ("" + str(random.randint(0, 999999)))
-            if not sid in self.__sid_functionname:
-                self.__sid_functionname[sid] = functionName
-            else:
-                sid_created = False
+        return await call_result
 
-        if not sid_created:
+    async def __call(self, sessionid, functionName ,  inparameter ,  ttlms , progress_callback):
+        sid = self.__dbcore.sidAllocator.acquire()
+        if sid is None:
             raise dBError.dBError("E107")
-            return
 
-        async def _call(resolve , reject):
-            async def timeexpire():
-                self.__dispatch.unbind(sid)
-                del self.__sid_functionname[sid]
-                reject(dBError.dBError("E069"))
-                await util.updatedBNewtworkCF(
-                    self.__dbcore , dBTypes.messageType.RPC_CALL_TIMEOUT, None,sid,None , None , None , None , None );
-            if ttlms < 100:
-                new_ttlms = ttlms / 1000
-            else:
-                new_ttlms = ttlms
-            r = aioTimer.Timer(new_ttlms, timeexpire)
+        self.__sid_functionname[sid] = functionName
+
+        async def timeexpire():
+            self.__dbcore.metrics.labeled_counter("dbridges_call_timeouts_total", "Calls that timed out",
+                                                  "type").inc(self.__callerTYPE)
+            await util.updatedBNewtworkCF(
+                self.__dbcore , dBTypes.messageType.RPC_CALL_TIMEOUT, None,sid,None , None , None , None , None );
+            self.__complete_call(sid, None, dBError.dBError("E069"))
 
-            def successResolve(value):
-                r.cancel()
-                resolve(value)
-            def successReject(value):
-                r.cancel()
-                reject(value)
+        if ttlms < 100:
+            new_ttlms = ttlms / 1000
+        else:
+            new_ttlms = ttlms
 
-            p = await self.__call_internal(sessionid ,functionName , inparameter,sid ,  progress_callback)
-            p.then(successResolve).catch(successReject)
-            return p
+        r = self.__dbcore.callTimer(new_ttlms, timeexpire)
+        started = time.monotonic()
+        try:
+            return await self.__call_internal(sessionid ,functionName , inparameter,sid ,  progress_callback)
+        finally:
+            r.cancel()
+            self.__dbcore.metrics.histogram("dbridges_cf_call_seconds",
+                                            "Call latency in seconds").observe(time.monotonic() - started)
+            if sid in self.__sid_pending:
+                del self.__sid_pending[sid]
+            if sid in self.__sid_functionname:
+                del self.__sid_functionname[sid]
+            self.__dbcore.sidAllocator.release(sid)
 
+    def call_async(self, sessionid, functionName ,  inparameter ,  ttlms , progress_callback=None):
+        return asyncio.ensure_future(self.__call(sessionid, functionName, inparameter, ttlms, progress_callback))
+
+    async def call(self, sessionid, functionName ,  inparameter ,  ttlms , progress_callback):
         pr = aioPromise.Promise()
-        await pr.Execute(_call)
+        await pr.Wait(self.call_async(sessionid, functionName, inparameter, ttlms, progress_callback))
         return pr
 
+    def stream(self, sessionid, functionName, inparameter, ttlms, maxsize=64):
+        responses = aioStream.Stream(maxsize)
+        return responses.start(self.call_async(sessionid, functionName, inparameter, ttlms, responses.put))
+
     async def resetqueue(self):
         m_status  = await util.updatedBNewtworkCF(self.__dbcore, dBTypes.messageType.CF_CALLEE_QUEUE_EXCEEDED, None, None, None, None, None, None, None)
         if not m_status:
@@ -0,0 +1,129 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+import asyncio
+import collections
+import logging
+import time
+
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+
+class Batcher:
+    def __init__(self, writer, maxsize=64, delay=0.0005, maxqueue=10000):
+        self.__writer = writer
+        self.maxsize = maxsize
+        self.delay = delay
+        self.maxqueue = maxqueue
+        self.__queue = collections.deque()
+        self.__timer = None
+        self.__flushing = None
+        self.__drained = None
+
+        self.flush_count = 0
+        self.frames_sent = 0
+        self.frames_failed = 0
+        self.last_flush_latency = 0
+        self.max_flush_latency = 0
+        self.__total_flush_latency = 0
+
+    def queue_depth(self):
+        return len(self.__queue)
+
+    async def put(self, frame):
+        await self.__wait_space()
+        self.__queue.append(frame)
+        self.__schedule()
+
+    async def put_many(self, frames):
+        for frame in frames:
+            if 0 < self.maxqueue <= len(self.__queue):
+                await self.__wait_space()
+            self.__queue.append(frame)
+        self.__schedule()
+
+    async def __wait_space(self):
+        while self.maxqueue > 0 and len(self.__queue) >= self.maxqueue:
+            if self.__drained is None:
+                self.__drained = asyncio.Event()
+            self.__drained.clear()
+            self.__start_flush()
+            await self.__drained.wait()
+
+    def __schedule(self):
+        if self.__flushing is not None or not self.__queue:
+            return
+
+        if len(self.__queue) >= self.maxsize:
+            self.__start_flush()
+        elif self.__timer is None:
+            self.__timer = asyncio.get_event_loop().call_later(self.delay, self.__start_flush)
+
+    def __start_flush(self):
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if self.__flushing is None:
+            self.__flushing = tracing.detach(self.__flush())
+
+    async def __flush(self):
+        try:
+            while self.__queue:
+                started = time.monotonic()
+                count = len(self.__queue)
+                if 0 < self.maxsize < count:
+                    count = self.maxsize
+                batch = [self.__queue.popleft() for _ in range(count)]
+                if self.__drained is not None and len(self.__queue) < self.maxqueue:
+                    self.__drained.set()
+                try:
+                    flags = await self.__writer(batch)
+                except Exception as e:
+                    logger.exception("outbound batch of %d frames failed", len(batch))
+                    flags = [False] * len(batch)
+                sent = sum(1 for flag in flags if flag)
+                self.frames_sent += sent
+                self.frames_failed += len(batch) - sent
+
+                latency = time.monotonic() - started
+                self.flush_count += 1
+                self.last_flush_latency = latency
+                self.__total_flush_latency += latency
+                if latency > self.max_flush_latency:
+                    self.max_flush_latency = latency
+        finally:
+            self.__flushing = None
+            if self.__drained is not None:
+                self.__drained.set()
+
+    def stats(self):
+        avg_flush_latency = 0
+        if self.flush_count > 0:
+            avg_flush_latency = self.__total_flush_latency / self.flush_count
+        return {"queue_depth": len(self.__queue),
+                "flush_count": self.flush_count,
+                "frames_sent": self.frames_sent,
+                "frames_failed": self.frames_failed,
+                "last_flush_latency_ms": self.last_flush_latency * 1000,
+                "avg_flush_latency_ms": avg_flush_latency * 1000,
+                "max_flush_latency_ms": self.max_flush_latency * 1000}
@@ -0,0 +1,104 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+import asyncio
+import collections
+import logging
+
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+
+class Lanes:
+    def __init__(self, max_pending=0, overflow="block"):
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.__lanes = {}
+        self.__tasks = {}
+        self.__space = None
+
+        self.dropped = 0
+        self.rejected = 0
+
+    def __len__(self):
+        return len(self.__lanes)
+
+    def pending(self, key):
+        lane = self.__lanes.get(key)
+        if lane is None:
+            return 0
+        return len(lane)
+
+    async def submit(self, key, target, *args, on_drop=None):
+        lane = self.__lanes.get(key)
+        while lane is not None and 0 < self.max_pending <= len(lane):
+            if self.overflow == "reject":
+                self.rejected += 1
+                self.__discard(on_drop)
+                return False
+            if self.overflow == "drop_oldest":
+                self.__discard(lane.popleft()[2])
+                self.dropped += 1
+                break
+            if self.__space is None:
+                self.__space = asyncio.Event()
+            self.__space.clear()
+            await self.__space.wait()
+            lane = self.__lanes.get(key)
+
+        if lane is not None:
+            lane.append((target, args, on_drop))
+            return True
+        self.__lanes[key] = collections.deque([(target, args, on_drop)])
+        self.__tasks[key] = tracing.detach(self.__drain(key))
+        return True
+
+    async def __drain(self, key):
+        lane = self.__lanes[key]
+        try:
+            while lane:
+                target, args, on_drop = lane.popleft()
+                if self.__space is not None:
+                    self.__space.set()
+                try:
+                    await target(*args)
+                except Exception as e:
+                    logger.exception("ordered delivery lane task failed")
+        finally:
+            del self.__lanes[key]
+            del self.__tasks[key]
+            if self.__space is not None:
+                self.__space.set()
+
+    def __discard(self, on_drop):
+        if on_drop is None:
+            return
+        try:
+            on_drop()
+        except Exception as e:
+            logger.exception("on_drop callback failed")
+
+    def stats(self):
+        return {"lanes": len(self.__lanes),
+                "queued": sum(len(lane) for lane in self.__lanes.values()),
+                "dropped": self.dropped,
+                "rejected": self.rejected}
@@ -20,6 +20,7 @@
 """
 
 import asyncio
+from ..exceptions import dBError
 
 class Promise:
     def __init__(self):
@@ -35,6 +36,14 @@ class Promise:
         else:
             await callback(self.resolve, self.reject)
 
+    async def Wait(self, awaitable):
+        self.resolved = ''
+        self.rejected = ''
+        try:
+            self.resolve(await awaitable)
+        except dBError.dBError as error:
+            self.reject(error)
+
     def resolve(self, value):
         self.resolved = value
 
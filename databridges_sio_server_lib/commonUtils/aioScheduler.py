@@ -0,0 +1,115 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+import asyncio
+import collections
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TaskScheduler:
+    def __init__(self, max_concurrency=0, max_queue=0, overflow="block"):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.__queue = collections.deque()
+        self.__space = None
+
+        self.running = 0
+        self.completed = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    def queued(self):
+        return len(self.__queue)
+
+    def __has_slot(self):
+        return self.max_concurrency <= 0 or self.running < self.max_concurrency
+
+    async def submit(self, target, *args, droppable=False, on_drop=None):
+        if not self.__queue and self.__has_slot():
+            self.__start(target, args)
+            return True
+
+        if self.max_queue > 0 and len(self.__queue) >= self.max_queue:
+            if self.overflow == "reject":
+                if droppable:
+                    self.rejected += 1
+                    self.__discard(on_drop)
+                    return False
+            elif self.overflow == "drop_oldest":
+                if not self.__drop_oldest() and droppable:
+                    self.dropped += 1
+                    self.__discard(on_drop)
+                    return False
+            else:
+                while len(self.__queue) >= self.max_queue:
+                    if self.__space is None:
+                        self.__space = asyncio.Event()
+                    self.__space.clear()
+                    await self.__space.wait()
+                if not self.__queue and self.__has_slot():
+                    self.__start(target, args)
+                    return True
+
+        self.__queue.append((target, args, droppable, on_drop))
+        return True
+
+    def __drop_oldest(self):
+        for index, entry in enumerate(self.__queue):
+            if entry[2]:
+                del self.__queue[index]
+                self.dropped += 1
+                self.__discard(entry[3])
+                return True
+        return False
+
+    def __discard(self, on_drop):
+        if on_drop is None:
+            return
+        try:
+            on_drop()
+        except Exception as e:
+            logger.exception("on_drop callback failed")
+
+    def __start(self, target, args):
+        self.running += 1
+        task = asyncio.ensure_future(target(*args))
+        task.add_done_callback(self.__done)
+
+    def __done(self, task):
+        self.running -= 1
+        self.completed += 1
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("scheduled task failed", exc_info=task.exception())
+        while self.__queue and self.__has_slot():
+            target, args, droppable, on_drop = self.__queue.popleft()
+            self.__start(target, args)
+        if self.__space is not None:
+            self.__space.set()
+
+    def stats(self):
+        return {"queued": len(self.__queue),
+                "running": self.running,
+                "completed": self.completed,
+                "dropped": self.dropped,
+                "rejected": self.rejected}
@@ -0,0 +1,121 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+import asyncio
+import collections
+
+
+class Stream:
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.__items = collections.deque()
+        self.__task = None
+        self.__reader = None
+        self.__writers = collections.deque()
+        self.__reserved = 0
+        self.__finished = False
+        self.__closed = False
+
+    def start(self, task):
+        self.__task = task
+        task.add_done_callback(self.__completed)
+        return self
+
+    async def put(self, payload):
+        if self.maxsize > 0 and not self.__closed and \
+                (self.__writers or len(self.__items) + self.__reserved >= self.maxsize):
+            writer = asyncio.get_event_loop().create_future()
+            self.__writers.append(writer)
+            try:
+                await writer
+            except asyncio.CancelledError:
+                if not writer.done() or writer.cancelled():
+                    self.__writers.remove(writer)
+                elif not self.__closed:
+                    self.__reserved -= 1
+                    self.__wake_writer()
+                raise
+            if self.__closed:
+                return
+            self.__reserved -= 1
+        if self.__closed:
+            return
+        self.__items.append(payload)
+        self.__wake_reader()
+
+    def __completed(self, task):
+        self.__wake_reader()
+
+    def __wake_reader(self):
+        if self.__reader is not None and not self.__reader.done():
+            self.__reader.set_result(None)
+        self.__reader = None
+
+    def __wake_writer(self):
+        while self.__writers:
+            writer = self.__writers.popleft()
+            if not writer.done():
+                writer.set_result(None)
+                self.__reserved += 1
+                return
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            if self.__closed or self.__finished:
+                raise StopAsyncIteration
+            if self.__items:
+                payload = self.__items.popleft()
+                self.__wake_writer()
+                return payload
+            if self.__task.done():
+                self.__finished = True
+                if self.__task.cancelled():
+                    raise StopAsyncIteration
+                return self.__task.result()
+            self.__reader = asyncio.get_event_loop().create_future()
+            await self.__reader
+
+    async def aclose(self):
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__items.clear()
+        while self.__writers:
+            writer = self.__writers.popleft()
+            if not writer.done():
+                writer.set_result(None)
+        self.__wake_reader()
+        if self.__task is not None and not self.__task.done():
+            self.__task.cancel()
+            try:
+                await self.__task
+            except BaseException as e:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
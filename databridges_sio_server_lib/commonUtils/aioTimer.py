@@ -20,9 +20,22 @@
 """
 
 import asyncio
+import logging
+import math
+
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+
+def _report(task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("timer callback failed", exc_info=task.exception())
+
+
 class Timer:
     def __init__(self, delay, callback):
-        self._future = asyncio.ensure_future(
+        self._future = tracing.detach(
             self._schedule_delayed_task(
                 delay,
                 callback,
@@ -42,3 +55,87 @@ class Timer:
 
     def cancel(self):
         self._future.cancel()
+
+
+class WheelTimer:
+    __slots__ = ("_wheel", "_slot", "_key", "callback", "target")
+
+    def __init__(self, wheel, slot, key, callback, target):
+        self._wheel = wheel
+        self._slot = slot
+        self._key = key
+        self.callback = callback
+        self.target = target
+
+    def cancel(self):
+        if self._wheel is not None:
+            self._wheel._remove(self)
+            self._wheel = None
+
+
+class TimerWheel:
+    def __init__(self, resolution=0.01, slots=1024):
+        self.resolution = resolution
+        self.__resolution = resolution
+        self.__slots = [{} for _ in range(slots)]
+        self.__origin = 0
+        self.__tick = 0
+        self.__next_key = 0
+        self.__count = 0
+        self.__driver = None
+
+    def __len__(self):
+        return self.__count
+
+    def schedule(self, delay, callback):
+        loop = asyncio.get_event_loop()
+        if self.__driver is None and self.__count == 0:
+            self.__resolution = self.resolution
+            self.__origin = loop.time()
+            self.__tick = 0
+
+        target = math.ceil((loop.time() + delay - self.__origin) / self.__resolution)
+        if target < self.__tick:
+            target = self.__tick
+        slot = target % len(self.__slots)
+        self.__next_key += 1
+        handle = WheelTimer(self, slot, self.__next_key, callback, target)
+        self.__slots[slot][handle._key] = handle
+        self.__count += 1
+
+        if self.__driver is None:
+            self.__driver = tracing.detach(self.__run())
+        return handle
+
+    def _remove(self, handle):
+        if self.__slots[handle._slot].pop(handle._key, None) is not None:
+            self.__count -= 1
+
+    async def __run(self):
+        loop = asyncio.get_event_loop()
+        try:
+            while self.__count > 0:
+                await asyncio.sleep(self.__resolution)
+                now = int((loop.time() - self.__origin) / self.__resolution)
+                while self.__tick <= now and self.__count > 0:
+                    self.__expire(self.__tick)
+                    self.__tick += 1
+        finally:
+            self.__driver = None
+
+    def __expire(self, tick):
+        bucket = self.__slots[tick % len(self.__slots)]
+        if not bucket:
+            return
+        due = [handle for handle in bucket.values() if handle.target <= tick]
+        for handle in due:
+            del bucket[handle._key]
+            handle._wheel = None
+            self.__count -= 1
+            try:
+                if asyncio.iscoroutinefunction(handle.callback):
+                    asyncio.ensure_future(handle.callback()).add_done_callback(_report)
+                else:
+                    handle.callback()
+            except Exception as e:
+                logger.exception("timer callback failed")
@@ -0,0 +1,46 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+class Metadata(dict):
+    __slots__ = ()
+
+    def __readonly(self, *args, **kwargs):
+        raise TypeError("event metadata is read-only, use metadata.copy() for a writable dict")
+
+    __setitem__ = __delitem__ = __ior__ = __readonly
+    update = pop = popitem = clear = setdefault = __readonly
+
+    def copy(self):
+        return dict(self)
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+def ChannelMetadata(channelname=None, eventname=None, sourcesysid=None, sqnum=None, sessionid=None, intime=None):
+    return Metadata(channelname=channelname, eventname=eventname, sourcesysid=sourcesysid, sqnum=sqnum,
+                    sessionid=sessionid, intime=intime)
+
+
+def ServerMetadata(servername=None, eventname=None, sourcesysid=None, sqnum=None, sessionid=None, intime=None):
+    return Metadata(servername=servername, eventname=eventname, sourcesysid=sourcesysid, sqnum=sqnum,
+                    sessionid=sessionid, intime=intime)
@@ -0,0 +1,167 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+class Counter:
+    __slots__ = ("name", "help", "value")
+    kind = "counter"
+
+    def __init__(self, name, help=""):
+        self.name = name
+        self.help = help
+        self.value = 0
+
+    def inc(self, value=1):
+        self.value += value
+
+    def snapshot(self):
+        return self.value
+
+    def prometheus(self):
+        return ["%s %s" % (self.name, self.value)]
+
+
+class LabeledCounter:
+    __slots__ = ("name", "help", "label", "__keyname", "values")
+    kind = "counter"
+
+    def __init__(self, name, help="", label="type", keyname=None):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.__keyname = keyname
+        self.values = {}
+
+    def inc(self, key, value=1):
+        values = self.values
+        values[key] = values.get(key, 0) + value
+
+    def __label(self, key):
+        if self.__keyname is None:
+            return str(key)
+        return self.__keyname(key)
+
+    def snapshot(self):
+        return {self.__label(key): value for key, value in self.values.items()}
+
+    def prometheus(self):
+        return ['%s{%s="%s"} %s' % (self.name, self.label, self.__label(key), value)
+                for key, value in self.values.items()]
+
+
+class Histogram:
+    kind = "summary"
+    quantiles = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, name, help="", unit=0.000001, precision=3):
+        self.name = name
+        self.help = help
+        self.__unit = unit
+        self.__precision = precision
+        self.__exact = 1 << (precision + 1)
+        self.__counts = {}
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+        units = int(value / self.__unit)
+        if units < self.__exact:
+            index = max(units, 0)
+        else:
+            shift = units.bit_length() - self.__precision - 1
+            index = (shift << self.__precision) + (units >> shift)
+        counts = self.__counts
+        counts[index] = counts.get(index, 0) + 1
+
+    def __upper(self, index):
+        if index < self.__exact:
+            return (index + 1) * self.__unit
+        shift = (index >> self.__precision) - 1
+        mantissa = index - (shift << self.__precision)
+        return ((mantissa + 1) << shift) * self.__unit
+
+    def percentile(self, quantile):
+        if self.count == 0:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for index in sorted(self.__counts):
+            seen += self.__counts[index]
+            if seen >= rank:
+                return min(self.__upper(index), self.max)
+        return self.max
+
+    def snapshot(self):
+        result = {"count": self.count, "sum": self.sum, "max": self.max}
+        for quantile in self.quantiles:
+            result["p" + ("%g" % (quantile * 100)).replace(".", "")] = self.percentile(quantile)
+        return result
+
+    def prometheus(self):
+        lines = ['%s{quantile="%g"} %s' % (self.name, quantile, self.percentile(quantile))
+                 for quantile in self.quantiles]
+        lines.append("%s_sum %s" % (self.name, self.sum))
+        lines.append("%s_count %s" % (self.name, self.count))
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.__metrics = {}
+
+    def counter(self, name, help=""):
+        metric = self.__metrics.get(name)
+        if metric is None:
+            metric = self.__metrics[name] = Counter(name, help)
+        return metric
+
+    def labeled_counter(self, name, help="", label="type", keyname=None):
+        metric = self.__metrics.get(name)
+        if metric is None:
+            metric = self.__metrics[name] = LabeledCounter(name, help, label, keyname)
+        return metric
+
+    def histogram(self, name, help="", unit=0.000001, precision=3):
+        metric = self.__metrics.get(name)
+        if metric is None:
+            metric = self.__metrics[name] = Histogram(name, help, unit, precision)
+        return metric
+
+    def get(self, name):
+        return self.__metrics.get(name)
+
+    def snapshot(self):
+        return {name: metric.snapshot() for name, metric in self.__metrics.items()}
+
+    def prometheus(self):
+        lines = []
+        for metric in self.__metrics.values():
+            if metric.help:
+                lines.append("# HELP %s %s" % (metric.name, metric.help))
+            lines.append("# TYPE %s %s" % (metric.name, metric.kind))
+            lines.extend(metric.prometheus())
+        return "\n".join(lines) + "\n"
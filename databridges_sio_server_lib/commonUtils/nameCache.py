@@ -0,0 +1,72 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+import collections
+import re
+
+VALID = 0
+EMPTY = 1
+TOO_LONG = 2
+INVALID = 3
+BAD_PREFIX = 4
+
+_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9.:_-]*$')
+
+
+class NameCache:
+    def __init__(self, types, maxsize=1024, maxlength=64):
+        self.__types = types
+        self.maxsize = maxsize
+        self.__maxlength = maxlength
+        self.__names = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self.__names)
+
+    def parse(self, name):
+        entry = self.__names.get(name)
+        if entry is not None:
+            self.__names.move_to_end(name)
+            return entry
+
+        entry = self.__parse(name)
+        self.__names[name] = entry
+        if len(self.__names) > self.maxsize:
+            self.__names.popitem(last=False)
+        return entry
+
+    def __parse(self, name):
+        lname = name.lower()
+        if not name.strip():
+            return EMPTY, None, lname
+        if len(name) > self.__maxlength:
+            return TOO_LONG, None, lname
+        if not _NAME_PATTERN.match(name):
+            return INVALID, None, lname
+        if ":" in lname:
+            ctype = lname.split(":", 1)[0]
+            if ctype not in self.__types:
+                return BAD_PREFIX, None, lname
+            return VALID, ctype, lname
+        return VALID, "", lname
+
+    def clear(self):
+        self.__names.clear()
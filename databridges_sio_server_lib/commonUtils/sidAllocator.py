@@ -0,0 +1,51 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+class SidAllocator:
+    def __init__(self, start=1, limit=2147483647):
+        self.__start = start
+        self.__limit = limit
+        self.__next = start
+        self.__inuse = set()
+
+    def acquire(self):
+        if len(self.__inuse) > self.__limit - self.__start:
+            return None
+
+        while True:
+            sid = str(self.__next)
+            if self.__next >= self.__limit:
+                self.__next = self.__start
+            else:
+                self.__next += 1
+            if sid not in self.__inuse:
+                self.__inuse.add(sid)
+                return sid
+
+    def release(self, sid):
+        self.__inuse.discard(sid)
+
+    def isInUse(self, sid):
+        return sid in self.__inuse
+
+    def in_use(self):
+        return len(self.__inuse)
@@ -0,0 +1,95 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+import asyncio
+import contextvars
+import time
+
+_current = contextvars.ContextVar("dbridges_span", default=None)
+
+
+def current():
+    span = _current.get()
+    if span is not None and span.closed:
+        return None
+    return span
+
+
+def detach(coro):
+    context = contextvars.copy_context()
+    context.run(_current.set, None)
+    return context.run(asyncio.ensure_future, coro)
+
+
+class Span:
+    __slots__ = ("direction", "msgtype", "channel", "event", "sid", "stages", "__tracer", "__pending", "__closed")
+
+    def __init__(self, tracer, direction, msgtype, channel=None, event=None, sid=None, stage="received"):
+        self.direction = direction
+        self.msgtype = msgtype
+        self.channel = channel
+        self.event = event
+        self.sid = sid
+        self.stages = [(stage, time.perf_counter())]
+        self.__tracer = tracer
+        self.__pending = 0
+        self.__closed = False
+
+    def mark(self, stage):
+        self.stages.append((stage, time.perf_counter()))
+
+    def activate(self):
+        return _current.set(self)
+
+    def deactivate(self, token):
+        _current.reset(token)
+
+    @property
+    def closed(self):
+        return self.__closed
+
+    def hold(self):
+        if self.__closed:
+            return False
+        self.__pending += 1
+        return True
+
+    def release(self):
+        self.__pending -= 1
+        self.__finish()
+
+    def close(self, stage):
+        self.mark(stage)
+        self.__closed = True
+        self.__finish()
+
+    def durations(self):
+        started = self.stages[0][1]
+        return [(stage, (at - started) * 1000) for stage, at in self.stages]
+
+    def __finish(self):
+        if not self.__closed or self.__pending > 0:
+            return
+        try:
+            self.__tracer(self)
+        except Exception as e:
+            pass
@@ -21,65 +21,95 @@
 
 import asyncio
 import math
-import random
+
+from ..messageTypes import dBFrame, dBTypes
+
+_MESSAGE_TYPE_NAMES = {m.value: m.name.lower() for m in dBTypes.messageType}
+
+def EncodePayload(payload):
+    if payload is None:
+        return b""
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, memoryview):
+        if isinstance(payload.obj, bytes) and payload.nbytes == len(payload.obj):
+            return payload.obj
+        return payload.tobytes()
+    if isinstance(payload, bytearray):
+        return bytes(payload)
+    return payload.encode()
+
+
+def MessageTypeName(value):
+    return _MESSAGE_TYPE_NAMES.get(value, str(value))
+
+
+def PayloadSize(payload):
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return len(payload)
+    if isinstance(payload, str):
+        return len(payload.encode())
+    return 0
+
+
+def DecodePayload(payload, binary=False):
+    if binary:
+        if payload is None:
+            return b""
+        return payload
+    if not payload:
+        return ""
+    try:
+        return str(payload, 'utf-8')
+    except Exception as e:
+        return payload
+
+
+def NewFrameSC(dbmsgtype, channelName, sid, channelToken, subject=None, source_id=None, t1=None,  seqnum=None):
+    return dBFrame.frame(dbmsgtype.value, subject, None, sid, EncodePayload(channelToken), channelName, None, None,
+                         None, t1, None, 0, source_id, None, None, seqnum)
+
+
+def NewFrameCF(dbmsgtype , sessionid, functionName , returnSubject , sid , payload , rspend , rtrack ):
+    return dBFrame.frame(dbmsgtype.value, functionName, returnSubject, sid, EncodePayload(payload), sessionid, rspend,
+                         rtrack, None, None, None, 0, None, None, None, None)
+
+
+async def RunBounded(target, items, limit=0):
+    if limit <= 0 or len(items) <= limit:
+        return await asyncio.gather(*[target(item) for item in items], return_exceptions=True)
+
+    results = [None] * len(items)
+    position = iter(range(len(items)))
+
+    async def worker():
+        for index in position:
+            try:
+                results[index] = await target(items[index])
+            except Exception as e:
+                results[index] = e
+
+    await asyncio.gather(*[worker() for _ in range(limit)])
+    return results
+
 
 async def updatedBNewtworkSC(dbcore, dbmsgtype, channelName, sid, channelToken, subject=None, source_id=None, t1=None,  seqnum=None):
-    if channelToken is not None:
-        mpayload = channelToken.encode()
-    else:
-        mpayload = "".encode()
-
-    msgDbp = {"eventname": "db",
-              "dbmsgtype": dbmsgtype.value,
-              "subject": subject,
-              "rsub": None,
-              "sid": sid,
-              "payload": mpayload,
-              "fenceid": channelName,
-              "rspend": None,
-              "rtrack": None,
-              "rtrackstat": None,
-              "t1": t1,
-              "latency": None,
-              "globmatch": 0,
-              "sourceid": source_id,
-              "sourceip": None,
-              "replylatency": None,
-              "oqueumonitorid": seqnum}
-
-    asyncStates = await dbcore.send(msgDbp)
+    asyncStates = await dbcore.send(NewFrameSC(dbmsgtype, channelName, sid, channelToken, subject, source_id, t1, seqnum))
     return asyncStates
 
 
+async def updatedBNewtworkSCMany(dbcore, dbmsgtype, channelName, sids, channelToken, subject=None, source_id=None, t1=None,
+                                seqnum=None):
+    payload = EncodePayload(channelToken)
+    sids = list(dict.fromkeys(sids))
+    asyncStates = await dbcore.send_many([NewFrameSC(dbmsgtype, channelName, sid, payload, subject, source_id, t1, seqnum)
+                                          for sid in sids])
+    return dict(zip(sids, asyncStates))
+
+
 async def updatedBNewtworkCF(dbcore , dbmsgtype , sessionid, functionName , returnSubject , sid , payload , rspend , rtrack ):
-    if payload is not None:
-        mpayload = payload.encode()
-    else:
-        mpayload = "".encode()
-
-
-
-    msgDbp = {"eventname": "db",
-              "dbmsgtype": dbmsgtype.value,
-              "subject": functionName,
-              "rsub": returnSubject,
-              "sid": sid,
-              "payload": mpayload,
-              "fenceid": sessionid,
-              "rspend": rspend,
-              "rtrack": rtrack,
-              "rtrackstat": None,
-              "t1": None,
-              "latency": None,
-              "globmatch": 0,
-              "sourceid": None,
-              "sourceip": None,
-              "replylatency": None,
-              "oqueumonitorid": None}
-
-    asyncStates = await dbcore.send(msgDbp)
+    asyncStates = await dbcore.send(NewFrameCF(dbmsgtype, sessionid, functionName, returnSubject, sid, payload, rspend,
+                                               rtrack))
     return asyncStates
 
 
-def GenerateUniqueId():
-    return ("" + str(random.randint(0, 999999)))
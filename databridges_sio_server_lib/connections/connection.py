@@ -20,11 +20,13 @@
 """
 
 import asyncio
+import collections
 from ..dispatchers import dispatcher
 from ..events import dBConnectionEvents
-from ..commonUtils import util
+from ..commonUtils import tracing, util
 
 from ..messageTypes import dBTypes
+import math
 import time
 
 from ..exceptions import dBError
@@ -34,24 +36,91 @@ class connectStates:
     def __init__(self, dBCoreObject):
         self.state = ""
         self.isconnected = False
-        self.__registry = dispatcher.dispatcher()
+        self.__registry = dispatcher.dispatcher(dBCoreObject)
         self.__newLifeCycle = True
         self.reconnect_attempt = 0
         self.__dbcore = dBCoreObject
         self.rttms = None
         self.__inner_connectList = [dBConnectionEvents.states.CONNECTED, dBConnectionEvents.states.RECONNECTED,
                                     dBConnectionEvents.states.RTTPONG, dBConnectionEvents.states.RTTPING]
+        self.__inner_infoList = [dBConnectionEvents.states.RESUBSCRIBE_COMPLETE, dBConnectionEvents.states.RTTSTALL]
+        self.__rttProbes = collections.deque()
+        self.__rttSamples = collections.deque(maxlen=100)
+        self.__rttMonitor = None
+        self.__rttStalled = False
 
     async def rttping(self, payload=None):
-        t1 = round(time.time() )
+        t1 = round(time.time())
+        probe = (t1, time.monotonic())
+        self.__rttProbes.append(probe)
+        while len(self.__rttProbes) > self.__rttSamples.maxlen:
+            self.__rttProbes.popleft()
         m_status = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SYSTEM_MSG, None, None, payload,
                                            "rttping",
                                            None,
                                             t1,
                                            None)
         if not m_status:
+            try:
+                self.__rttProbes.remove(probe)
+            except ValueError:
+                pass
             raise dBError.dBError("E011")
 
+    def rttpong(self, t1):
+        index = next((index for index, probe in enumerate(self.__rttProbes) if probe[0] == t1), None)
+        if index is None:
+            rtt = time.time() - t1
+        else:
+            for _ in range(index):
+                self.__rttProbes.popleft()
+            rtt = time.monotonic() - self.__rttProbes.popleft()[1]
+            self.__rttSamples.append(rtt * 1000)
+        self.__rttStalled = False
+        self.rttms = round(rtt * 1000)
+        return rtt
+
+    def rttstats(self):
+        samples = sorted(self.__rttSamples)
+        count = len(samples)
+        if count == 0:
+            return {"count": 0, "last": None, "min": None, "max": None, "p50": None, "p95": None, "p99": None}
+
+        def percentile(quantile):
+            return samples[min(count - 1, max(0, math.ceil(quantile * count) - 1))]
+
+        return {"count": count, "last": self.__rttSamples[-1], "min": samples[0], "max": samples[-1],
+                "p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99)}
+
+    def __startRttMonitor(self):
+        if self.__rttMonitor is not None or self.__dbcore.rttInterval <= 0:
+            return
+        if self.__rttSamples.maxlen != self.__dbcore.rttWindow:
+            self.__rttSamples = collections.deque(self.__rttSamples, maxlen=max(1, self.__dbcore.rttWindow))
+        self.__rttMonitor = tracing.detach(self.__runRttMonitor())
+
+    def __stopRttMonitor(self):
+        if self.__rttMonitor is not None:
+            self.__rttMonitor.cancel()
+            self.__rttMonitor = None
+        self.__rttProbes.clear()
+        self.__rttStalled = False
+
+    async def __runRttMonitor(self):
+        while self.isconnected:
+            if self.__rttProbes and not self.__rttStalled:
+                elapsed = time.monotonic() - self.__rttProbes[0][1]
+                if 0 < self.__dbcore.rttStallTimeout <= elapsed:
+                    self.__rttStalled = True
+                    await self.handledispatcher(dBConnectionEvents.states.RTTSTALL,
+                                                {"elapsed_ms": elapsed * 1000, "outstanding": len(self.__rttProbes)})
+            try:
+                await self.rttping()
+            except Exception as e:
+                pass
+            await asyncio.sleep(self.__dbcore.rttInterval)
+        self.__rttMonitor = None
+
     def set_newLifeCycle(self, value):
         self.__newLifeCycle = value
 
@@ -86,10 +155,18 @@ class connectStates:
 
     async def handledispatcher(self, eventName, eventInfo=None):
         try:
+            if eventName in self.__inner_infoList:
+                await self.__registry.emit_connectionState(eventName, eventInfo)
+                return
+
             previous = self.state
             if eventName.value not in ["reconnect_attempt", 'rttpong']:
                 self.state = eventName.value;
             self.updatestates(eventName)
+            if eventName in [dBConnectionEvents.states.CONNECTED, dBConnectionEvents.states.RECONNECTED]:
+                self.__startRttMonitor()
+            elif not self.isconnected:
+                self.__stopRttMonitor()
 
             if eventName != previous:
                 if eventName.value != "reconnect_attempt":
@@ -52,7 +52,8 @@ from .remoteProcedure import rpc
 
 from .remoteProcedure import rpcState
 from .remoteProcedure import rpcClient
-from .commonUtils import aioTimer
+from .commonUtils import aioTimer, aioBatcher, aioLanes, aioScheduler, eventMetadata, metrics, sidAllocator, tracing, util
+import functools
 import math
 import urllib.parse
 import requests
@@ -61,14 +62,14 @@ from threading import Timer
 import random
 import urllib3
 import json
+import logging
 import time
 from urllib.request import urlretrieve
 from urllib.parse import urlencode
 
 urllib3.disable_warnings()
 
-internal_in_count = 0
-internal_out_count = 0
+logger = logging.getLogger(__name__)
 
 class dBridges:
     def __init__(self):
@@ -78,6 +79,18 @@ class dBridges:
         self.appsecret = None
         self.appkey = None
 
+        self.sidAllocator = sidAllocator.SidAllocator()
+        self.metrics = metrics.Registry()
+        self.__framesIn = self.metrics.labeled_counter("dbridges_frames_in_total", "Frames received by message type",
+                                                       "type", util.MessageTypeName)
+        self.__bytesIn = self.metrics.counter("dbridges_bytes_in_total", "Payload bytes received")
+        self.__framesOut = self.metrics.labeled_counter("dbridges_frames_out_total", "Frames sent by message type",
+                                                        "type", util.MessageTypeName)
+        self.__bytesOut = self.metrics.counter("dbridges_bytes_out_total", "Payload bytes sent")
+        self.__sendFailures = self.metrics.counter("dbridges_send_failures_total", "Frames the socket failed to send")
+        self.__publishFailures = self.metrics.counter("dbridges_publish_failures_total",
+                                                      "Publish and sendmsg calls rejected with E014")
+        self.__reconnects = self.metrics.counter("dbridges_reconnect_attempts_total", "Reconnect attempts")
         self.connectionstate = connection.connectStates(self)
         self.channel = station.channels(self)
         self.__options = {}
@@ -86,22 +99,74 @@ class dBridges:
         self.maxReconnectionDelay = 120
         self.minReconnectionDelay = 1 + random.randint(0, 1) * 4
         self.reconnectionDelayGrowFactor = 1.3;
+        self.reconnectionJitter = 0.2
         self.minUptime = 0.5
         self.connectionTimeout = 10
+        self.resubscribeConcurrency = 64
         self.autoReconnect = True
+        self.outboundBatching = False
+        self.outboundBatchSize = 64
+        self.outboundBatchDelay = 0.0005
+        self.outboundQueueLimit = 10000
+        self.binaryPayload = False
+        self.callTimeoutResolution = 0.01
+        self.inboundConcurrency = 0
+        self.inboundQueueLimit = 0
+        self.inboundOverflow = "block"
+        self.orderedDelivery = False
+        self.handlerConcurrency = 0
+        self.handlerQueueLimit = 0
+        self.handlerOverflow = "block"
+        self.rttInterval = 0
+        self.rttWindow = 100
+        self.rttStallTimeout = 5
+        self.tracer = None
 
         self.__uptimeTimeout = None
+        self.__outbound = None
+        self.__inbound = None
+        self.__lanes = None
+        self.__callTimers = aioTimer.TimerWheel()
         self.__retryCount = 0
+        self.__reconnectState = "idle"
+        self.__reconnectTask = None
+        self.__httpSession = None
+
+        self.__pendingAcks = set()
+        self.__earlyAcks = set()
+        self.__openPending = False
+        self.__openTimer = None
 
         self.__lifeCycle = 0
         self.__isServerReconnect = False
-        self.__dispatch = dispatcher.dispatcher()
+        self.__dispatch = dispatcher.dispatcher(self)
         self.cf = clientFunction.cfclient(self)
         self.__disconnectedBy = ""
         self.rpc = rpc.CRpc(self)
-        self.__metadata = {"channelname": None, "eventname": None, "sourcesysid": None,
-                           "sqnum": None, "sessionid": None, "intime": None,
-                           }
+        self.__channelEventTypes = {
+            dBTypes.messageType.PUBLISH_TO_CHANNEL.value,
+            dBTypes.messageType.PARTICIPANT_JOIN.value,
+            dBTypes.messageType.PARTICIPANT_LEFT.value,
+        }
+        self.__IOHandlers = {
+            dBTypes.messageType.SYSTEM_MSG.value: self.__IOSystemMsg,
+            dBTypes.messageType.SERVER_SUBSCRIBE_TO_CHANNEL.value: self.__IOSubscribeToChannel,
+            dBTypes.messageType.SERVER_UNSUBSCRIBE_DISCONNECT_FROM_CHANNEL.value: self.__IOUnsubscribeFromChannel,
+            dBTypes.messageType.PUBLISH_TO_CHANNEL.value: self.__IOPublishToChannel,
+            dBTypes.messageType.PARTICIPANT_JOIN.value: self.__IOParticipantJoin,
+            dBTypes.messageType.PARTICIPANT_LEFT.value: self.__IOParticipantLeft,
+            dBTypes.messageType.CF_CALL_RECEIVED.value: self.__IOCfCallReceived,
+            dBTypes.messageType.CF_CALL_RESPONSE.value: self.__IOCfCallResponse,
+            dBTypes.messageType.CF_RESPONSE_TRACKER.value: self.__IOCfResponseTracker,
+            dBTypes.messageType.CF_CALLEE_QUEUE_EXCEEDED.value: self.__IOCfCalleeQueueExceeded,
+            dBTypes.messageType.CONNECT_TO_RPC_SERVER.value: self.__IOConnectToRpcServer,
+            dBTypes.messageType.RPC_CALL_RECEIVED.value: self.__IORpcCall,
+            dBTypes.messageType.RPC_CALL_RESPONSE.value: self.__IORpcCall,
+            dBTypes.messageType.RPC_RESPONSE_TRACKER.value: self.__IORpcResponseTracker,
+            dBTypes.messageType.RPC_CALLEE_QUEUE_EXCEEDED.value: self.__IORpcCalleeQueueExceeded,
+            dBTypes.messageType.REGISTER_RPC_SERVER.value: self.__IORegisterRpcServer,
+            dBTypes.messageType.UNREGISTER_RPC_SERVER.value: self.__IOUnregisterRpcServer,
+        }
 
     def access_token(self, callback):
         if not callback:
@@ -122,6 +187,7 @@ class dBridges:
 
     async def __acceptOpen(self):
         self.__retryCount = 0
+        self.__reconnectState = "idle"
         self.connectionstate.reconnect_attempt = self.__retryCount
 
         if self.__lifeCycle == 0:
@@ -130,6 +196,34 @@ class dBridges:
         else:
             await self.connectionstate.handledispatcher(dBConnectionEvents.states.RECONNECTED)
 
+    def __cancelOpen(self):
+        if self.__openTimer is not None:
+            self.__openTimer.cancel()
+            self.__openTimer = None
+        self.__openPending = False
+        self.__pendingAcks.clear()
+        self.__earlyAcks.clear()
+
+    async def __openReady(self):
+        if not self.__openPending:
+            return
+        self.__cancelOpen()
+        await self.__acceptOpen()
+
+    async def __openWindowExpired(self):
+        self.__openTimer = None
+        await self.__openReady()
+
+    async def __resubscribeAcked(self, sid):
+        if not self.__openPending:
+            return
+        if self.__openTimer is None:
+            self.__earlyAcks.add(sid)
+            return
+        self.__pendingAcks.discard(sid)
+        if not self.__pendingAcks:
+            await self.__openReady()
+
     def __getNextDelay(self):
         delay = 0
         if self.__retryCount > 0:
@@ -141,12 +235,30 @@ class dBridges:
                 delay = self.minReconnectionDelay
         return delay
 
-    def __wait(self):
-        time.sleep(self.__getNextDelay())
+    async def __wait(self):
+        delay = self.__getNextDelay()
+        if self.reconnectionJitter > 0:
+            delay = delay * (1 + self.reconnectionJitter * (2 * random.random() - 1))
+        await asyncio.sleep(max(delay, 0))
 
     async def __reconnect(self):
+        if self.__reconnectState == "backoff":
+            return
+        self.__reconnectState = "backoff"
+        self.__reconnectTask = tracing.detach(self.__reconnectCycle())
+
+    def __cancelReconnect(self):
+        cancelled = self.__reconnectState == "backoff"
+        if cancelled and self.__reconnectTask:
+            self.__reconnectTask.cancel()
+        self.__reconnectTask = None
+        self.__reconnectState = "idle"
+        return cancelled
+
+    async def __reconnectCycle(self):
         try:
             if self.__retryCount >= self.maxReconnectionRetries:
+                self.__reconnectState = "idle"
                 await self.connectionstate.handledispatcher(dBConnectionEvents.states.RECONNECT_FAILED, dBError.dBError("E060"))
                 if self.__ClientSocket:
                     self.__ClientSocket = None
@@ -156,14 +268,29 @@ class dBridges:
                 await self.channel.cleanUp_All()
                 await self.rpc.cleanUp_All()
                 await self.connectionstate.handledispatcher(dBConnectionEvents.states.DISCONNECTED, None)
+                await self.__closeHttpSession()
 
 
             else:
                 self.__retryCount += 1
-                self.__wait()
+                self.__reconnects.inc()
+                await self.__wait()
+                self.__reconnectState = "connecting"
+                self.__reconnectTask = None
                 self.connectionstate.reconnect_attempt = self.__retryCount
                 await self.connectionstate.handledispatcher(dBConnectionEvents.states.RECONNECTING, None)
-                await self.connect()
+                try:
+                    await self.connect()
+                except Exception as e:
+                    if not isinstance(e, dBError.dBError):
+                        e = dBError.dBError("E063")
+                    await self.connectionstate.handledispatcher(dBConnectionEvents.states.RECONNECT_ERROR, e)
+                    if self.autoReconnect:
+                        if self.__ClientSocket:
+                            self.__ClientSocket = None
+                        await self.__reconnect()
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             pass
 
@@ -188,7 +315,18 @@ class dBridges:
 
     async def disconnect(self):
         self.__disconnectedBy = "io client disconnect"
-        await self.__ClientSocket.disconnect()
+        if self.__cancelReconnect():
+            self.__lifeCycle = 0
+            self.__retryCount = 0
+            self.connectionstate.set_newLifeCycle(True)
+            await self.channel.cleanUp_All()
+            await self.rpc.cleanUp_All()
+            await self.connectionstate.handledispatcher(dBConnectionEvents.states.DISCONNECTED, None)
+            await self.__closeHttpSession()
+            return
+        if self.__ClientSocket:
+            await self.__ClientSocket.disconnect()
+        await self.__closeHttpSession()
 
 
     def getauth_sign(self):
@@ -252,12 +390,12 @@ class dBridges:
                 raise e
             else:
                 await self.shouldRestart(e)
-
-
+                return
 
         if not jdata:
             db = dBError.dBError("E008")
             await self.shouldRestart(db)
+            return
 
         secure = jdata["secured"]
         if secure:
@@ -338,9 +476,8 @@ class dBridges:
                         "lib-transport": "sio",
                         "User-Agent": "Mozilla/5.0"
                         }
-            timeout = aiohttp.ClientTimeout(total=60)
-            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(verify_ssl=False)) as session:
-                r = await session.post(auth_url, data="{}", headers=iheaders)
+            session = self.__getHttpSession()
+            async with session.post(auth_url, data="{}", headers=iheaders) as r:
 
                 if r.status != 200:
                     dberror = dBError.dBError("E006")
@@ -369,7 +506,24 @@ class dBridges:
             raise dberror
 
 
+    def __getHttpSession(self):
+        if self.__httpSession is None or self.__httpSession.closed:
+            timeout = aiohttp.ClientTimeout(total=60)
+            self.__httpSession = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False),
+                                                       timeout=timeout)
+        return self.__httpSession
+
+    async def __closeHttpSession(self):
+        if self.__httpSession is not None:
+            session = self.__httpSession
+            self.__httpSession = None
+            try:
+                await session.close()
+            except Exception as e:
+                pass
+
     async def disconnected(self):
+        self.__cancelOpen()
         try:
             if self.__ClientSocket:
                 await self.__IOEventReconnect(self.__disconnectedBy)
@@ -397,7 +551,8 @@ class dBridges:
                     await self.channel.cleanUp_All()
                     await self.rpc.cleanUp_All()
 
-                    await self.connectionstate.handledispatcher(dBConnectionEvents.states.DISCONNECTED, None);
+                    await self.connectionstate.handledispatcher(dBConnectionEvents.states.DISCONNECTED, None)
+                    await self.__closeHttpSession()
 
                 else:
                     await self.connectionstate.handledispatcher(dBConnectionEvents.states.CONNECTION_BREAK,
@@ -411,12 +566,14 @@ class dBridges:
                 if self.__ClientSocket:
                     self.__ClientSocket = None
 
+                self.__cancelReconnect()
                 self.__lifeCycle = 0
                 self.__retryCount = 0
                 self.connectionstate.set_newLifeCycle(True)
                 await self.channel.cleanUp_All()
                 await self.rpc.cleanUp_All()
                 await self.connectionstate.handledispatcher(dBConnectionEvents.states.DISCONNECTED, None)
+                await self.__closeHttpSession()
             else:
                 if reason != "io server disconnect" and reason != "io client disconnect":
 
@@ -430,7 +587,8 @@ class dBridges:
                         self.connectionstate.set_newLifeCycle(True)
                         await self.channel.cleanUp_All()
                         await self.rpc.cleanUp_All()
-                        await self.connectionstate.handledispatcher(dBConnectionEvents.states.DISCONNECTED, None);
+                        await self.connectionstate.handledispatcher(dBConnectionEvents.states.DISCONNECTED, None)
+                        await self.__closeHttpSession()
                     else:
                         await self.__reconnect()
 
@@ -465,20 +623,103 @@ class dBridges:
             return False
 
     async def send(self, msgDbp):
+        if self.tracer is not None:
+            return await self.__traceSend(msgDbp)
+        if not self.outboundBatching:
+            return await self.__emit(msgDbp)
+
+        if not self.__ClientSocket:
+            return False
+
+        await self.__batcher().put(msgDbp)
+        return True
+
+    async def send_many(self, frames):
+        if self.tracer is not None:
+            return [await self.send(msgDbp) for msgDbp in frames]
+        if not self.outboundBatching:
+            return await self.__emitMany(frames)
+
+        if not self.__ClientSocket:
+            return [False] * len(frames)
+
+        await self.__batcher().put_many(frames)
+        return [True] * len(frames)
+
+    def __batcher(self):
+        if self.__outbound is None:
+            self.__outbound = aioBatcher.Batcher(self.__emitMany, self.outboundBatchSize, self.outboundBatchDelay,
+                                                 self.outboundQueueLimit)
+        return self.__outbound
+
+    async def __traceSend(self, msgDbp):
+        span = tracing.Span(self.tracer, "outbound", msgDbp[0], msgDbp[5], msgDbp[1], msgDbp[3], "send")
         flag = False
         try:
+            if not self.outboundBatching:
+                flag = await self.__emit(msgDbp)
+                return flag
+            if not self.__ClientSocket:
+                return False
+            await self.__batcher().put(msgDbp)
+            flag = True
+            return True
+        finally:
+            if not flag:
+                span.close("failed")
+            elif self.outboundBatching:
+                span.close("queued")
+            else:
+                span.close("sent")
+
+    def outboundStats(self):
+        if self.__outbound is None:
+            return {"queue_depth": 0, "flush_count": 0, "frames_sent": 0, "frames_failed": 0,
+                    "last_flush_latency_ms": 0, "avg_flush_latency_ms": 0, "max_flush_latency_ms": 0}
+        return self.__outbound.stats()
 
-            await self.__ClientSocket.emit("db", (msgDbp["dbmsgtype"],
-                                                    msgDbp["subject"],msgDbp["rsub"], msgDbp["sid"],
-                                                    msgDbp["payload"], msgDbp["fenceid"], msgDbp["rspend"],
-                                                    msgDbp["rtrack"], msgDbp["rtrackstat"], msgDbp["t1"],
-                                                    msgDbp["latency"], msgDbp["globmatch"], msgDbp["sourceid"],
-                                                        msgDbp["sourceip"],msgDbp["replylatency"], msgDbp["oqueumonitorid"]))
+    def inboundStats(self):
+        if self.__inbound is None:
+            stats = {"queued": 0, "running": 0, "completed": 0, "dropped": 0, "rejected": 0}
+        else:
+            stats = self.__inbound.stats()
+        if self.__lanes is not None:
+            lanes = self.__lanes.stats()
+            stats["queued"] += lanes["queued"]
+            stats["dropped"] += lanes["dropped"]
+            stats["rejected"] += lanes["rejected"]
+        return stats
+
+    def publishFailed(self):
+        self.__publishFailures.inc()
+
+    def __calleeQueueExceeded(self, callertype):
+        self.metrics.labeled_counter("dbridges_callee_queue_exceeded_total", "Callee queue exceeded notifications",
+                                     "type").inc(callertype)
+
+    def callTimer(self, delay, callback):
+        self.__callTimers.resolution = self.callTimeoutResolution
+        return self.__callTimers.schedule(delay, callback)
+
+    async def __emit(self, msgDbp):
+        flag = False
+        try:
 
+            await self.__ClientSocket.emit("db", msgDbp)
+            self.__framesOut.inc(msgDbp[0])
+            self.__bytesOut.inc(len(msgDbp[4]))
             return True
         except Exception as e:
+            logger.warning("emit of message type %s failed: %r", msgDbp[0], e)
+            self.__sendFailures.inc()
             return False
 
+    async def __emitMany(self, frames):
+        flags = []
+        for msgDbp in frames:
+            flags.append(await self.__emit(msgDbp))
+        return flags
+
 
     async def connect_failed(self, info):
         await self.connectionstate.handledispatcher(dBConnectionEvents.states.ERROR, None)
@@ -503,7 +744,7 @@ class dBridges:
         except Exception as e:
            pass
 
-    def IOMessage(self, *args):
+    async def IOMessage(self, *args):
         dbmsgtype = args[0]
         subject = args[1]
         rsub = args[2]
@@ -511,7 +752,7 @@ class dBridges:
         p_payload = args[4]
         fenceid = args[5]
         rspend = args[6]
-        rtrack = args[5]
+        rtrack = args[7]
         rtrackstat = args[8]
         t1 = args[9]
         latency = args[10]
@@ -521,12 +762,33 @@ class dBridges:
         replylatency = args[14]
         oqueumonitorid = args[15]
         try:
+            self.__framesIn.inc(dbmsgtype)
+            self.__bytesIn.inc(util.PayloadSize(p_payload))
             if self.__ClientSocket:
-                task = self.__ClientSocket.start_background_task(self.__IOMessage ,  dbmsgtype, subject,
-                                                                rsub, sid, p_payload, fenceid, rspend,
-                                                                rtrack, rtrackstat, t1,latency, globmatch,
-                                                                sourceid, sourceip, replylatency,
-                                                                oqueumonitorid)
+                target = self.__IOMessage
+                on_drop = None
+                if self.tracer is not None:
+                    span = tracing.Span(self.tracer, "inbound", dbmsgtype, None, subject, sid)
+                    target = functools.partial(self.__traceIOMessage, span)
+                    on_drop = functools.partial(span.close, "dropped")
+                if self.orderedDelivery and dbmsgtype in self.__channelEventTypes:
+                    if self.__lanes is None:
+                        self.__lanes = aioLanes.Lanes(self.inboundQueueLimit, self.inboundOverflow)
+                    await self.__lanes.submit(sid, target, dbmsgtype, subject,
+                                              rsub, sid, p_payload, fenceid, rspend,
+                                              rtrack, rtrackstat, t1, latency, globmatch,
+                                              sourceid, sourceip, replylatency,
+                                              oqueumonitorid, on_drop=on_drop)
+                    return
+                if self.__inbound is None:
+                    self.__inbound = aioScheduler.TaskScheduler(self.inboundConcurrency, self.inboundQueueLimit,
+                                                                self.inboundOverflow)
+                await self.__inbound.submit(target ,  dbmsgtype, subject,
+                                            rsub, sid, p_payload, fenceid, rspend,
+                                            rtrack, rtrackstat, t1,latency, globmatch,
+                                            sourceid, sourceip, replylatency,
+                                            oqueumonitorid,
+                                            droppable=dbmsgtype in self.__channelEventTypes, on_drop=on_drop)
         except Exception as e:
             pass
 
@@ -550,9 +812,28 @@ class dBridges:
 
     async def __IOMessage(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
                     globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
-        mchannelName = None
-        metadata = None
-
+        handler = self.__IOHandlers.get(dbmsgtype)
+        if handler:
+            await handler(dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                          globmatch, sourceid, sourceip, replylatency, oqueumonitorid)
+
+    async def __traceIOMessage(self, span, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat,
+                               t1, latency, globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        token = span.activate()
+        try:
+            span.mark("started")
+            handler = self.__IOHandlers.get(dbmsgtype)
+            span.channel = self.channel.get_channelName(sid)
+            span.mark("routed")
+            if handler:
+                await handler(dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                              globmatch, sourceid, sourceip, replylatency, oqueumonitorid)
+        finally:
+            span.deactivate(token)
+            span.close("done")
+
+    async def __IOSystemMsg(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
         recieved = round(time.time())
 
         recdDate = 0
@@ -560,333 +841,292 @@ class dBridges:
             recdDate = t1
 
         lib_latency = recieved - recdDate
-        caller = None
-        dberr = None
-        rpccaller = None
-        extradata = None
-
-        if dbmsgtype == dBTypes.messageType.SYSTEM_MSG.value:
-            if subject == "connection:success":
-                self.sessionid = str(payload, 'utf-8')
-                if self.connectionstate.get_newLifeCycle():
-                    if self.cf.enable:
-                        if asyncio.iscoroutinefunction(self.cf.functions):
-                            await self.cf.functions()
-                        else:
-                            self.cf.functions()
-
-                self.connectionstate.set_newLifeCycle(False)
-                if self.minUptime < 0:
-                    waittime = 5
-                else:
-                    waittime = self.minUptime
-
-                await self.rpc.ReSubscribeAll()
-                await self.channel.ReSubscribeAll()
-
-                r = aioTimer.Timer(waittime, self.__acceptOpen)
-                await r.wait()
-
-                if t1:
-                    await self.Rttpong(dbmsgtype, "rttpong", rsub, sid, payload, fenceid,
-                                                              rspend, rtrack, rtrackstat, t1, lib_latency, globmatch,
-                                                              sourceid, sourceip, replylatency, oqueumonitorid)
-
-            if subject == "rttping":
-                if t1:
-                    await self.Rttpong(dbmsgtype, "rttpong", rsub, sid, payload, fenceid,
-                                 rspend, rtrack, rtrackstat, t1, lib_latency, globmatch,
-                                 sourceid, sourceip, replylatency, oqueumonitorid)
-            if subject == "rttpong":
-                if t1:
-                    eventData = (time.time()*1000) / 1000 -  t1
-                    self.connectionstate.rttms = round(eventData * 1000)
-                    await self.connectionstate.handledispatcher(dBConnectionEvents.states.RTTPONG, eventData)
-
-            if subject == "reconnect":
-                self.__isServerReconnect = True
-                self.__disconnectedBy = "io server disconnect"
-                await self.__ClientSocket.disconnect()
-
-            if subject not in ["reconnect","rttpong", "rttping", "connection:success" ]:
-                dberr = dBError.dBError("E082")
-                dberr.updateCode(subject, payload.decode("utf-8") )
-                await self.connectionstate.handledispatcher(dBConnectionEvents.states.ERROR, dberr)
-            pass
 
-        if dbmsgtype == dBTypes.messageType.SERVER_SUBSCRIBE_TO_CHANNEL.value:
-            sidStatus = self.channel.get_subscribeStatus(sid)
-            if subject == "success":
-                if sidStatus == channelState.states.SUBSCRIPTION_INITIATED:
-                    await self.channel.updateChannelsStatusAddChange(0, sid,
-                                                               channelState.states.SUBSCRIPTION_ACCEPTED, "")
-                if sidStatus == channelState.states.SUBSCRIPTION_ACCEPTED or sidStatus == channelState.states.SUBSCRIPTION_PENDING:
-                    await self.channel.updateChannelsStatusAddChange(1, sid,
-                                                               channelState.states.SUBSCRIPTION_ACCEPTED, "")
+        if subject == "connection:success":
+            self.sessionid = str(payload, 'utf-8')
+            if self.connectionstate.get_newLifeCycle():
+                if self.cf.enable:
+                    if asyncio.iscoroutinefunction(self.cf.functions):
+                        await self.cf.functions()
+                    else:
+                        self.cf.functions()
+
+            self.connectionstate.set_newLifeCycle(False)
+            self.__cancelOpen()
+            self.__openPending = True
+            if self.minUptime < 0:
+                waittime = 5
             else:
-                dberr = dBError.dBError("E064")
-                if payload:
-                    dberr.updateCode(str(subject).upper(), str(payload))
-                else:
-                    dberr.updateCode(str(subject).upper(), "")
+                waittime = self.minUptime
+
+            started = time.monotonic()
+            rpcsids, channelsids = await asyncio.gather(self.rpc.ReSubscribeAll(self.resubscribeConcurrency),
+                                                        self.channel.ReSubscribeAll(self.resubscribeConcurrency))
+            if self.__lifeCycle > 0:
+                await self.connectionstate.handledispatcher(dBConnectionEvents.states.RESUBSCRIBE_COMPLETE,
+                                                            {"channels": len(channelsids), "rpc": len(rpcsids),
+                                                             "elapsed_ms": (time.monotonic() - started) * 1000})
+
+            self.__pendingAcks.update(rpcsids)
+            self.__pendingAcks.update(channelsids)
+            self.__pendingAcks.difference_update(self.__earlyAcks)
+            self.__earlyAcks.clear()
+            if self.__pendingAcks:
+                self.__openTimer = aioTimer.Timer(waittime, self.__openWindowExpired)
+            else:
+                await self.__openReady()
 
-                if sidStatus == channelState.states.SUBSCRIPTION_INITIATED:
-                    await self.channel.updateChannelsStatusAddChange(0, sid, channelState.states.SUBSCRIPTION_ERRORs,
-                                                               dberr)
-                    if sidStatus == channelState.states.SUBSCRIPTION_ACCEPTED or sidStatus == channelState.states.SUBSCRIPTION_PENDING:
-                        await self.channel.updateChannelsStatusAddChange(1, sid,
-                                                                   channelState.states.SUBSCRIPTION_PENDING, dberr)
+            if t1:
+                await self.Rttpong(dbmsgtype, "rttpong", rsub, sid, payload, fenceid,
+                                                          rspend, rtrack, rtrackstat, t1, lib_latency, globmatch,
+                                                          sourceid, sourceip, replylatency, oqueumonitorid)
 
+        if subject == "rttping":
+            if t1:
+                await self.Rttpong(dbmsgtype, "rttpong", rsub, sid, payload, fenceid,
+                             rspend, rtrack, rtrackstat, t1, lib_latency, globmatch,
+                             sourceid, sourceip, replylatency, oqueumonitorid)
+        if subject == "rttpong":
+            if t1:
+                eventData = self.connectionstate.rttpong(t1)
+                await self.connectionstate.handledispatcher(dBConnectionEvents.states.RTTPONG, eventData)
 
+        if subject == "reconnect":
+            self.__isServerReconnect = True
+            self.__disconnectedBy = "io server disconnect"
+            await self.__ClientSocket.disconnect()
 
-        if dbmsgtype == dBTypes.messageType.SERVER_UNSUBSCRIBE_DISCONNECT_FROM_CHANNEL.value:
-            sidtype = self.channel.get_channelType(sid)
-            if subject == "success":
-                if sidtype == "s":
-                    await self.channel.updateChannelsStatusRemove(sid, channelState.states.UNSUBSCRIBE_ACCEPTED, "")
-                else:
-                    await self.channel.updateChannelsStatusRemove(sid, channelState.states.DISCONNECT_ACCEPTED, "")
+        if subject not in ["reconnect","rttpong", "rttping", "connection:success" ]:
+            dberr = dBError.dBError("E082")
+            dberr.updateCode(subject, payload.decode("utf-8") )
+            await self.connectionstate.handledispatcher(dBConnectionEvents.states.ERROR, dberr)
+
+    async def __IOSubscribeToChannel(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        sidStatus = self.channel.get_subscribeStatus(sid)
+        if subject == "success":
+            if sidStatus == channelState.states.SUBSCRIPTION_INITIATED:
+                await self.channel.updateChannelsStatusAddChange(0, sid,
+                                                           channelState.states.SUBSCRIPTION_ACCEPTED, "")
+            if sidStatus == channelState.states.SUBSCRIPTION_ACCEPTED or sidStatus == channelState.states.SUBSCRIPTION_PENDING:
+                await self.channel.updateChannelsStatusAddChange(1, sid,
+                                                           channelState.states.SUBSCRIPTION_ACCEPTED, "")
+        else:
+            dberr = dBError.dBError("E064")
+            if payload:
+                dberr.updateCode(str(subject).upper(), str(payload))
             else:
-                if sidtype == "s":
-                    dberr = dBError.dBError("E065")
-                    if payload:
-                        dberr.updateCode(str(subject).upper(), str(payload))
-                    else:
-                        dberr.updateCode(str(subject).upper(), "")
-                    await self.channel.updateChannelsStatusRemove(sid, channelState.states.UNSUBSCRIBE_ERROR, "")
-                else:
-                    dberr = dBError.dBError("E088")
-                    if payload:
-                        dberr.updateCode(str(subject).upper(), str(payload))
-                    else:
-                        dberr.updateCode(str(subject).upper(), "")
+                dberr.updateCode(str(subject).upper(), "")
 
-                    await self.channel.updateChannelsStatusRemove(sid, channelState.states.DISCONNECT_ERROR, "")
+            if sidStatus == channelState.states.SUBSCRIPTION_INITIATED:
+                await self.channel.updateChannelsStatusAddChange(0, sid, channelState.states.SUBSCRIPTION_ERRORs,
+                                                           dberr)
+                if sidStatus == channelState.states.SUBSCRIPTION_ACCEPTED or sidStatus == channelState.states.SUBSCRIPTION_PENDING:
+                    await self.channel.updateChannelsStatusAddChange(1, sid,
+                                                               channelState.states.SUBSCRIPTION_PENDING, dberr)
 
-        if dbmsgtype == dBTypes.messageType.PUBLISH_TO_CHANNEL.value:
-            mchannelName = self.channel.get_channelName(sid)
-            metadata =self.__metadata
-            metadata["eventname"] = subject
-            metadata["sourcesysid"] = sourceid
-            metadata["sessionid"] = sourceip
-            metadata["sqnum"] = oqueumonitorid
-            if t1:
-                metadata["intime"] = t1
+        await self.__resubscribeAcked(sid)
 
-            if  str(mchannelName).lower().startswith("sys:*"):
-                metadata["channelname"] = fenceid
+    async def __IOUnsubscribeFromChannel(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        sidtype = self.channel.get_channelType(sid)
+        if subject == "success":
+            if sidtype == "s":
+                await self.channel.updateChannelsStatusRemove(sid, channelState.states.UNSUBSCRIBE_ACCEPTED, "")
             else:
-                metadata["channelname"] = mchannelName
-            mpayload = ""
-            try:
+                await self.channel.updateChannelsStatusRemove(sid, channelState.states.DISCONNECT_ACCEPTED, "")
+        else:
+            if sidtype == "s":
+                dberr = dBError.dBError("E065")
                 if payload:
-                    mpayload = str(payload, 'utf-8')
-            except Exception as e:
-                mpayload = ""
-
-            await self.channel.handledispatcherEvents(subject, mpayload, mchannelName, metadata)
+                    dberr.updateCode(str(subject).upper(), str(payload))
+                else:
+                    dberr.updateCode(str(subject).upper(), "")
+                await self.channel.updateChannelsStatusRemove(sid, channelState.states.UNSUBSCRIBE_ERROR, "")
+            else:
+                dberr = dBError.dBError("E088")
+                if payload:
+                    dberr.updateCode(str(subject).upper(), str(payload))
+                else:
+                    dberr.updateCode(str(subject).upper(), "")
 
+                await self.channel.updateChannelsStatusRemove(sid, channelState.states.DISCONNECT_ERROR, "")
 
-        if dbmsgtype == dBTypes.messageType.PARTICIPANT_JOIN.value:
-            mchannelName = self.channel.get_channelName(sid)
-            metadata = self.__metadata
-            metadata["eventname"] = 'dbridges:participant.joined'
-            metadata["sourcesysid"] = sourceid
-            metadata["sessionid"] = sourceip
-            metadata["sqnum"] = oqueumonitorid
-            metadata["channelname"] = mchannelName
+    async def __IOPublishToChannel(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        m_object = self.channel.getEntry(sid)
+        if m_object is None or not self.channel.hasListeners(m_object, subject):
+            return
+        if m_object.isSysAll:
+            mchannelName = fenceid
+        else:
+            mchannelName = m_object.name
+        metadata = eventMetadata.ChannelMetadata(mchannelName, subject, sourceid, oqueumonitorid, sourceip, t1 or None)
+        mpayload = util.DecodePayload(payload, self.binaryPayload)
 
-            if str(mchannelName).lower().startswith("sys:") or str(mchannelName).lower().startswith("prs:"):
+        await self.channel.dispatchEntryEvents(m_object, subject, mpayload, metadata, self.orderedDelivery, True)
 
-                if str(mchannelName).lower().startswith("sys::*"):
-                    cresult = self.convertToObject(sourceip, sourceid, fenceid)
-                    metadata["sessionid"] =  cresult["s"]
-                    metadata["sourcesysid"] = cresult["sysid"]
-                    await self.channel.handledispatcherEvents('dbridges:participant.joined',cresult["i"] , mchannelName, metadata)
-                else:
-                    cresult = self.convertToObject(sourceip, sourceid)
-                    metadata["sessionid"] = cresult["s"]
-                    metadata["sourcesysid"] = cresult["sysid"]
-                    await self.channel.handledispatcherEvents('dbridges:participant.joined', cresult["i"], mchannelName, metadata)
-            else:
-                await self.channel.handledispatcherEvents('dbridges:participant.joined', {"sourcesysid":sourceid}, mchannelName, metadata)
-
-        if dbmsgtype == dBTypes.messageType.PARTICIPANT_LEFT.value:
-            mchannelName = self.channel.get_channelName(sid)
-            metadata = self.__metadata
-            metadata["eventname"] = 'dbridges:participant.left'
-            metadata["sourcesysid"] = sourceid
-            metadata["sessionid"] = sourceip
-            metadata["sqnum"] = oqueumonitorid
-            metadata["channelname"] = mchannelName
-
-            if str(mchannelName).lower().startswith("sys:") or str(mchannelName).lower().startswith("prs:"):
-                if str(mchannelName).lower().startswith("sys::*"):
-                    cresult = self.convertToObject(sourceip, sourceid, fenceid)
-                    metadata["sessionid"] = cresult["s"]
-                    metadata["sourcesysid"] = cresult["sysid"]
-                    await self.channel.handledispatcherEvents('dbridges:participant.left',
-                                                        cresult["i"], mchannelName,
-                                                        metadata)
-                else:
-                    cresult = self.convertToObject(sourceip, sourceid)
-                    metadata["sessionid"] = cresult["s"]
-                    metadata["sourcesysid"] = cresult["sysid"]
-                    await self.channel.handledispatcherEvents('dbridges:participant.left',
-                                                        cresult["i"], mchannelName,
-                                                        metadata)
+    async def __IOParticipantJoin(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        m_object = self.channel.getEntry(sid)
+        if m_object is None or not self.channel.hasListeners(m_object, 'dbridges:participant.joined'):
+            return
+        if m_object.isPresence:
+            if m_object.isFenced:
+                cresult = self.convertToObject(sourceip, sourceid, fenceid)
             else:
-                await self.channel.handledispatcherEvents('dbridges:participant.left', {"sourcesysid": sourceid},
-                                                    mchannelName, metadata)
+                cresult = self.convertToObject(sourceip, sourceid)
+            metadata = eventMetadata.ChannelMetadata(m_object.name, 'dbridges:participant.joined', cresult["sysid"],
+                                                     oqueumonitorid, cresult["s"])
+            await self.channel.dispatchEntryEvents(m_object, 'dbridges:participant.joined', cresult["i"], metadata,
+                                                   self.orderedDelivery, True)
+        else:
+            metadata = eventMetadata.ChannelMetadata(m_object.name, 'dbridges:participant.joined', sourceid,
+                                                     oqueumonitorid, sourceip)
+            await self.channel.dispatchEntryEvents(m_object, 'dbridges:participant.joined', {"sourcesysid": sourceid},
+                                                   metadata, self.orderedDelivery, True)
 
-        if dbmsgtype == dBTypes.messageType.CF_CALL_RECEIVED.value:
-            mpayload = None
+    async def __IOParticipantLeft(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        m_object = self.channel.getEntry(sid)
+        if m_object is None or not self.channel.hasListeners(m_object, 'dbridges:participant.left'):
+            return
+        if m_object.isPresence:
+            if m_object.isFenced:
+                cresult = self.convertToObject(sourceip, sourceid, fenceid)
+            else:
+                cresult = self.convertToObject(sourceip, sourceid)
+            metadata = eventMetadata.ChannelMetadata(m_object.name, 'dbridges:participant.left', cresult["sysid"],
+                                                     oqueumonitorid, cresult["s"])
+            await self.channel.dispatchEntryEvents(m_object, 'dbridges:participant.left', cresult["i"], metadata,
+                                                   self.orderedDelivery, True)
+        else:
+            metadata = eventMetadata.ChannelMetadata(m_object.name, 'dbridges:participant.left', sourceid,
+                                                     oqueumonitorid, sourceip)
+            await self.channel.dispatchEntryEvents(m_object, 'dbridges:participant.left', {"sourcesysid": sourceid},
+                                                   metadata, self.orderedDelivery, True)
 
-            try:
-                if payload:
-                    mpayload = str(payload, 'utf-8')
-                else:
-                    mpayload = ""
-            except Exception as e:
-                mpayload = ""
-            try:
-                await self.cf.handle_dispatcher(subject, rsub, sid, mpayload)
-            except Exception as e:
-                pass
+    async def __IOCfCallReceived(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        mpayload = util.DecodePayload(payload, self.binaryPayload)
+        try:
+            await self.cf.handle_dispatcher(subject, rsub, sid, mpayload)
+        except Exception as e:
+            pass
 
+    async def __IOCfCallResponse(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        mpayload = util.DecodePayload(payload, self.binaryPayload)
+        try:
+            await self.cf.handle_callResponse(sid, mpayload, rspend, rsub)
+        except Exception as e:
+            pass
 
+    async def __IOCfResponseTracker(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        await self.cf.handle_tracker_dispatcher(subject, rsub)
 
-        if dbmsgtype == dBTypes.messageType.CF_CALL_RESPONSE.value:
-            mpayload = None
-            try:
-                if payload:
-                    mpayload = str(payload, 'utf-8')
-                else:
-                    mpayload = ""
-            except Exception as e:
-                mpayload = ""
-            try:
-                await self.cf.handle_callResponse(sid, mpayload, rspend, rsub)
-            except Exception as e:
-                pass
+    async def __IOCfCalleeQueueExceeded(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        self.__calleeQueueExceeded("cf")
+        await self.cf.handle_exceed_dispatcher()
 
-        if dbmsgtype == dBTypes.messageType.CF_RESPONSE_TRACKER.value:
-            await self.cf.handle_tracker_dispatcher(subject, rsub)
-
-        if dbmsgtype == dBTypes.messageType.CF_CALLEE_QUEUE_EXCEEDED.value:
-            await self.cf.handle_exceed_dispatcher()
-
-        if dbmsgtype == dBTypes.messageType.CONNECT_TO_RPC_SERVER.value:
-            sidStatus = self.rpc.get_rpcStatus(sid)
-            if subject == "success":
-                if sidStatus == rpcState.states.RPC_CONNECTION_INITIATED:
-                    await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.RPC_CONNECTION_ACCEPTED,
-                                                               "")
-                if sidStatus == rpcState.states.RPC_CONNECTION_ACCEPTED or \
-                        sidStatus == rpcState.states.RPC_CONNECTION_PENDING:
-                    await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.RPC_CONNECTION_ACCEPTED,
-                                                               "")
+    async def __IOConnectToRpcServer(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        sidStatus = self.rpc.get_rpcStatus(sid)
+        if subject == "success":
+            if sidStatus == rpcState.states.RPC_CONNECTION_INITIATED:
+                await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.RPC_CONNECTION_ACCEPTED,
+                                                           "")
+            if sidStatus == rpcState.states.RPC_CONNECTION_ACCEPTED or \
+                    sidStatus == rpcState.states.RPC_CONNECTION_PENDING:
+                await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.RPC_CONNECTION_ACCEPTED,
+                                                           "")
+        else:
+            dberr = dBError.dBError("E082")
+            if payload:
+                dberr.updateCode(str(subject).upper(), str(payload))
             else:
-                dberr = dBError.dBError("E082")
-                if payload:
-                    dberr.updateCode(str(subject).upper(), str(payload))
-                else:
-                    dberr.updateCode(str(subject).upper(), "")
+                dberr.updateCode(str(subject).upper(), "")
 
 
-                if sidStatus == rpcState.states.RPC_CONNECTION_INITIATED:
-                    await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.RPC_CONNECTION_ERROR,
-                                                               dberr)
+            if sidStatus == rpcState.states.RPC_CONNECTION_INITIATED:
+                await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.RPC_CONNECTION_ERROR,
+                                                           dberr)
 
-                if sidStatus == rpcState.states.RPC_CONNECTION_ACCEPTED or \
-                        sidStatus == rpcState.states.RPC_CONNECTION_PENDING:
-                    await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.RPC_CONNECTION_PENDING,
-                                                               dberr)
+            if sidStatus == rpcState.states.RPC_CONNECTION_ACCEPTED or \
+                    sidStatus == rpcState.states.RPC_CONNECTION_PENDING:
+                await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.RPC_CONNECTION_PENDING,
+                                                           dberr)
 
-        if dbmsgtype == dBTypes.messageType.RPC_CALL_RECEIVED.value:
-            mpayload = None
-            if int(sid) > 0:
-                try:
-                    if payload:
-                        mpayload = str(payload, 'utf-8')
-                    else:
-                        mpayload = ""
-                except Exception as e:
-                    mpayload = ""
-                rpccaller = self.rpc.get_object(sid)
-                if rpccaller:
-                    await rpccaller.handle_callResponse(sid, mpayload, rspend, rsub)
-                else:
-                    rpccaller = self.rpc.get_rpcServerObject(sid)
-                    if rpccaller:
-                        await rpccaller.handle_dispatcher_WithObject(subject, rsub, sid, mpayload, sourceip, sourceid)
+        await self.__resubscribeAcked(sid)
 
-        if dbmsgtype == dBTypes.messageType.RPC_CALL_RESPONSE.value:
-            mpayload = None
-            if int(sid) > 0:
-                try:
-                    if payload:
-                        mpayload = str(payload, 'utf-8')
-                    else:
-                        mpayload = ""
-                except Exception as e:
-                    mpayload = ""
-                rpccaller = self.rpc.get_object(sid)
+    async def __IORpcCall(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        if int(sid) > 0:
+            mpayload = util.DecodePayload(payload, self.binaryPayload)
+            rpccaller = self.rpc.get_object(sid)
+            if rpccaller:
+                await rpccaller.handle_callResponse(sid, mpayload, rspend, rsub)
+            else:
+                rpccaller = self.rpc.get_rpcServerObject(sid)
                 if rpccaller:
-                    await rpccaller.handle_callResponse(sid, mpayload, rspend, rsub)
-                else:
-                    rpccaller = self.rpc.get_rpcServerObject(sid)
-                    if rpccaller:
-                        await rpccaller.handle_dispatcher_WithObject(subject, rsub, sid, mpayload, sourceip, sourceid)
-
-        if dbmsgtype == dBTypes.messageType.RPC_RESPONSE_TRACKER.value:
-            rpccaller = self.rpc.get_rpcServerObject(sid)
-            await rpccaller.handle_tracker_dispatcher(subject, rsub)
-
-
-        if dbmsgtype == dBTypes.messageType.RPC_CALLEE_QUEUE_EXCEEDED.value:
-            rpccaller = self.rpc.get_rpcServerObject(sid)
-            await rpccaller.handle_exceed_dispatcher()
-
-        if dbmsgtype == dBTypes.messageType.REGISTER_RPC_SERVER.value:
-            sidStatus = self.rpc.get_rpcStatus(sid)
-            if subject == "success":
-                if sidStatus == rpcState.states.REGISTRATION_INITIATED:
-                    await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.REGISTRATION_ACCEPTED,
-                                                               "")
-                if sidStatus == rpcState.states.REGISTRATION_ACCEPTED or \
-                        sidStatus == rpcState.states.REGISTRATION_PENDING:
-                    await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.REGISTRATION_ACCEPTED,
-                                                               "")
+                    await rpccaller.handle_dispatcher_WithObject(subject, rsub, sid, mpayload, sourceip, sourceid)
+
+    async def __IORpcResponseTracker(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        rpccaller = self.rpc.get_rpcServerObject(sid)
+        await rpccaller.handle_tracker_dispatcher(subject, rsub)
+
+    async def __IORpcCalleeQueueExceeded(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        self.__calleeQueueExceeded("rpc")
+        rpccaller = self.rpc.get_rpcServerObject(sid)
+        await rpccaller.handle_exceed_dispatcher()
+
+    async def __IORegisterRpcServer(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        sidStatus = self.rpc.get_rpcStatus(sid)
+        if subject == "success":
+            if sidStatus == rpcState.states.REGISTRATION_INITIATED:
+                await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.REGISTRATION_ACCEPTED,
+                                                           "")
+            if sidStatus == rpcState.states.REGISTRATION_ACCEPTED or \
+                    sidStatus == rpcState.states.REGISTRATION_PENDING:
+                await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.REGISTRATION_ACCEPTED,
+                                                           "")
+        else:
+            dberr = dBError.dBError("E081")
+            if payload:
+                dberr.updateCode(str(subject).upper(), str(payload))
             else:
-                dberr = dBError.dBError("E081")
-                if payload:
-                    dberr.updateCode(str(subject).upper(), str(payload))
-                else:
-                    dberr.updateCode(str(subject).upper(), "")
+                dberr.updateCode(str(subject).upper(), "")
+
 
+            if sidStatus == rpcState.states.REGISTRATION_INITIATED:
+                await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.REGISTRATION_ERROR,
+                                                           dberr)
 
-                if sidStatus == rpcState.states.REGISTRATION_INITIATED:
-                    await self.rpc.updateRegistrationStatusAddChange(0, sid, rpcState.states.REGISTRATION_ERROR,
-                                                               dberr)
+            if sidStatus == rpcState.states.REGISTRATION_ACCEPTED or \
+                    sidStatus == rpcState.states.REGISTRATION_PENDING:
+                await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.REGISTRATION_PENDING,
+                                                           dberr)
 
-                if sidStatus == rpcState.states.REGISTRATION_ACCEPTED or \
-                        sidStatus == rpcState.states.REGISTRATION_PENDING:
-                    await self.rpc.updateRegistrationStatusAddChange(1, sid, rpcState.states.REGISTRATION_PENDING,
-                                                               dberr)
+        await self.__resubscribeAcked(sid)
 
-        if dbmsgtype == dBTypes.messageType.UNREGISTER_RPC_SERVER.value:
-            sidStatus = self.rpc.get_rpcStatus(sid)
-            if subject == "success":
-                await  self.rpc.removeRegistration(sid ,  rpcState.states.UNREGISTRATION_ACCEPTED, "")
+    async def __IOUnregisterRpcServer(self, dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat, t1, latency,
+                    globmatch, sourceid, sourceip, replylatency, oqueumonitorid):
+        sidStatus = self.rpc.get_rpcStatus(sid)
+        if subject == "success":
+            await  self.rpc.removeRegistration(sid ,  rpcState.states.UNREGISTRATION_ACCEPTED, "")
+        else:
+            dberr = dBError.dBError("E081")
+            if payload:
+                dberr.updateCode(str(subject).upper(), str(payload))
             else:
-                dberr = dBError.dBError("E081")
-                if payload:
-                    dberr.updateCode(str(subject).upper(), str(payload))
-                else:
-                    dberr.updateCode(str(subject).upper(), "")
+                dberr.updateCode(str(subject).upper(), "")
 
-                await  self.rpc.removeRegistration(sid ,  rpcState.states.UNREGISTRATION_ERROR, dberr)
+            await  self.rpc.removeRegistration(sid ,  rpcState.states.UNREGISTRATION_ERROR, dberr)
 
     def convertToObject(self, sourceip, sourceid, channelname=None):
         sessionid = ""
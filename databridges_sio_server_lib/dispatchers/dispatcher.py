@@ -20,13 +20,16 @@
 """
 
 import asyncio
+from ..commonUtils import aioScheduler, tracing
 from ..exceptions import dBError
 
 
 class dispatcher:
-    def __init__(self):
+    def __init__(self, dBCoreObject=None):
         self.__local_register = {}
         self.__global_register = []
+        self.__dbcore = dBCoreObject
+        self.__tasks = None
 
     def isExists(self, eventName):
         if eventName in self.__local_register:
@@ -34,6 +37,16 @@ class dispatcher:
         else:
             return False
 
+    def hasListeners(self, eventName):
+        if self.__global_register:
+            return True
+        if self.__local_register.get(eventName):
+            return True
+        return False
+
+    def __plan(self, callback):
+        return (callback, asyncio.iscoroutinefunction(callback))
+
     def bind(self, eventName, callback):
         if not (eventName and not eventName.isspace()):
             raise dBError.dBError("E012")
@@ -41,15 +54,15 @@ class dispatcher:
             raise dBError.dBError("E013")
 
         if eventName not in self.__local_register:
-            self.__local_register[eventName] = [callback]
+            self.__local_register[eventName] = [self.__plan(callback)]
         else:
-            self.__local_register[eventName].append(callback)
+            self.__local_register[eventName].append(self.__plan(callback))
 
     def bind_all(self, callback):
         if not callback and not callable(callback):
             raise dBError.dBError("E013")
 
-        self.__global_register.append(callback)
+        self.__global_register.append(self.__plan(callback))
 
 
     def unbind(self, eventName, callback):
@@ -62,9 +75,8 @@ class dispatcher:
                 del self.__local_register[eventName]
 
             if eventName and callback:
-                for ca in self.__local_register[eventName]:
-                    if ca == callback:
-                        self.__local_register[eventName].remove(ca)
+                plans = self.__local_register[eventName]
+                plans[:] = [plan for plan in plans if plan[0] != callback]
         except Exception as e:
             pass
 
@@ -72,118 +84,119 @@ class dispatcher:
         if not callback:
             self.__global_register.clear()
         else:
-            if callback in self.__global_register:
-                self.__global_register.remove(callback)
+            for plan in self.__global_register:
+                if plan[0] == callback:
+                    self.__global_register.remove(plan)
+                    break
+
+    def set_task_limits(self, max_concurrency=0, max_queue=0, overflow="block"):
+        self.__tasks = aioScheduler.TaskScheduler(max_concurrency, max_queue, overflow)
+
+    def task_stats(self):
+        if self.__tasks is None:
+            return {"queued": 0, "running": 0, "completed": 0, "dropped": 0, "rejected": 0}
+        return self.__tasks.stats()
+
+    async def start_background_task(self, target, *args, droppable=False, on_drop=None):
+        if self.__tasks is None:
+            if self.__dbcore is None:
+                self.__tasks = aioScheduler.TaskScheduler()
+            else:
+                self.__tasks = aioScheduler.TaskScheduler(self.__dbcore.handlerConcurrency,
+                                                          self.__dbcore.handlerQueueLimit,
+                                                          self.__dbcore.handlerOverflow)
+        return await self.__tasks.submit(target, *args, droppable=droppable, on_drop=on_drop)
+
+    async def __invoke(self, plans, args, inline=False, droppable=False):
+        span = tracing.current()
+        if span is not None:
+            await self.__invokeTraced(span, plans, args, inline, droppable)
+            return
+        for callback, is_async in plans:
+            if not is_async:
+                callback(*args)
+            elif inline:
+                await callback(*args)
+            else:
+                await self.start_background_task(callback, *args, droppable=droppable)
+
+    async def __invokeTraced(self, span, plans, args, inline, droppable):
+        for callback, is_async in plans:
+            if not span.hold():
+                if not is_async:
+                    callback(*args)
+                elif inline:
+                    await callback(*args)
+                else:
+                    await self.start_background_task(callback, *args, droppable=droppable)
+                continue
+            if is_async and not inline:
+                await self.start_background_task(self.__runTraced, span, callback, args, droppable=droppable,
+                                                 on_drop=span.release)
+                continue
+            span.mark("handler_start")
+            try:
+                if is_async:
+                    await callback(*args)
+                else:
+                    callback(*args)
+            finally:
+                span.mark("handler_end")
+                span.release()
 
-    def start_background_task(self, target, *args):
-        asyncio.ensure_future(target(*args))
+    async def __runTraced(self, span, callback, args):
+        span.mark("handler_start")
+        try:
+            await callback(*args)
+        finally:
+            span.mark("handler_end")
+            span.release()
 
     async def emit2(self, eventName, channelName, sessionId, action, response):
         if eventName in self.__local_register:
-            callbacks = self.__local_register[eventName]
-            if len(callbacks) > 0:
-                for callback in callbacks:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(channelName, sessionId, action, response)
-                        self.start_background_task(callback , channelName, sessionId, action, response)
-
-                    else:
-                        callback(channelName, sessionId, action, response)
+            await self.__invoke(self.__local_register[eventName], (channelName, sessionId, action, response))
 
 
 
     async def emit_cf(self, functionName, inparameter, response):
         try:
             if functionName in self.__local_register:
-                callbacks = self.__local_register[functionName]
-                if len(callbacks) > 0:
-                    for callback in callbacks:
-                        if asyncio.iscoroutinefunction(callback):
-                            #await callback(inparameter, response)
-                            self.start_background_task(callback ,inparameter, response )
-                        else:
-                            callback(inparameter, response)
+                await self.__invoke(self.__local_register[functionName], (inparameter, response))
         except Exception as e:
             pass
 
 
 
-    async def emit_connectionState(self, eventName ,  payload=None ,  metadata=None):
+    async def emit_connectionState(self, eventName ,  payload=None ,  metadata=None, inline=False, droppable=False):
         if isinstance(eventName, str):
             eventName = eventName
         else:
             eventName = eventName.value
 
-        for callback in self.__global_register:
-            if not payload and not metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback()
-                    self.start_background_task(callback)
-                else:
-                    callback()
-
-            if not payload and  metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(None , metadata)
-                    self.start_background_task(callback,None , metadata)
-                else:
-                    callback(None , metadata)
-
-
-            if  payload and  metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(payload, metadata)
-                    self.start_background_task(callback, payload, metadata)
-                else:
-                    callback(payload, metadata)
-
-            if  payload and not metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(payload)
-                    self.start_background_task(callback, payload)
-                else:
-                    callback(payload)
+        if payload:
+            if metadata:
+                args = (payload, metadata)
+            else:
+                args = (payload,)
+        elif metadata:
+            args = (None, metadata)
+        else:
+            args = ()
 
+        if self.__global_register:
+            await self.__invoke(self.__global_register, args, inline, droppable)
 
+        plans = self.__local_register.get(eventName)
+        if plans:
+            await self.__invoke(plans, args, inline, droppable)
 
-        if eventName in self.__local_register:
-            callbacks = self.__local_register[eventName]
-            for callback in callbacks:
-                if not payload and not metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback()
-                        self.start_background_task(callback)
-                    else:
-                        callback()
-
-                if not payload and metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(None, metadata)
-                        self.start_background_task(callback, None, metadata)
-                    else:
-                        callback(None, metadata)
-
-                if payload and metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(payload, metadata)\
-                        self.start_background_task(callback, payload, metadata)
-                    else:
-                        callback(payload, metadata)
-
-                if payload and not metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(payload)
-                        self.start_background_task(callback, payload)
-                    else:
-                        callback(payload)
-
-    async def emit_channel(self, eventName, payload=None, metadata=None):
+    async def emit_channel(self, eventName, payload=None, metadata=None, inline=False, droppable=False):
         if isinstance(eventName, str):
             eventName = eventName
         else:
             eventName = eventName.value
 
-        await self.emit_connectionState(eventName, payload, metadata)
+        await self.emit_connectionState(eventName, payload, metadata, inline, droppable)
 
 
 
@@ -194,13 +207,7 @@ class dispatcher:
             functionName = functionName.value
 
         if functionName in self.__local_register:
-            callbacks = self.__local_register[functionName]
-            for callback in callbacks:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(inparameter , response)
-                    self.start_background_task(callback, inparameter, response)
-                else:
-                    callback(inparameter , response)
+            await self.__invoke(self.__local_register[functionName], (inparameter, response))
 
 
     async def emit_clientfunction2(self, functionName, inparameter, response=None, rsub=None):
@@ -210,13 +217,7 @@ class dispatcher:
             functionName = functionName.value
 
         if functionName in self.__local_register:
-            callbacks = self.__local_register[functionName]
-            for callback in callbacks:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(inparameter , response, rsub)
-                    self.start_background_task(callback, inparameter, response, rsub)
-                else:
-                    callback(inparameter , response, rsub)
+            await self.__invoke(self.__local_register[functionName], (inparameter, response, rsub))
 
 
     async def emit(self, eventNameT, EventInfo=None, channelName=None, metadata=None):
@@ -225,96 +226,25 @@ class dispatcher:
         else:
             eventName = eventNameT.value
 
-        for callback in self.__global_register:
-            if EventInfo and channelName and metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(eventName, channelName, EventInfo, metadata)
-                    self.start_background_task(callback, eventName, channelName, EventInfo, metadata)
-                else:
-                    callback(eventName, channelName, EventInfo, metadata)
-
-
-            if EventInfo and channelName and not metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(eventName, channelName, EventInfo)
-                    self.start_background_task(callback, eventName, channelName, EventInfo)
-                else:
-                    callback(eventName, channelName, EventInfo)
-
-
-            if EventInfo and not channelName and metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(eventName, EventInfo, metadata)
-                    self.start_background_task(callback, eventName, EventInfo, metadata)
-                else:
-                    callback(eventName, EventInfo, metadata)
-
-
-            if EventInfo and not channelName and not metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(eventName, EventInfo)
-                    self.start_background_task(callback, eventName, EventInfo)
-                else:
-                    callback(eventName, EventInfo)
-
-
-            if not EventInfo and not channelName and not metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(eventName)
-                    self.start_background_task(callback, eventName)
-                else:
-                    callback(eventName)
-
-
+        if EventInfo:
+            if channelName and metadata:
+                args = (eventName, channelName, EventInfo, metadata)
+            elif channelName:
+                args = (eventName, channelName, EventInfo)
+            elif metadata:
+                args = (eventName, EventInfo, metadata)
+            else:
+                args = (eventName, EventInfo)
+        elif metadata:
+            return
+        elif channelName:
+            args = (eventName, channelName)
+        else:
+            args = (eventName,)
 
-            if not EventInfo and channelName and not metadata:
-                if asyncio.iscoroutinefunction(callback):
-                    #await callback(eventName, channelName)
-                    self.start_background_task(callback, eventName, channelName)
-                else:
-                    callback(eventName, channelName)
+        if self.__global_register:
+            await self.__invoke(self.__global_register, args)
 
-        if eventName in self.__local_register:
-            callbacks = self.__local_register[eventName]
-            for callback in callbacks:
-                if EventInfo and channelName and metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(eventName, channelName, EventInfo, metadata)
-                        self.start_background_task(callback,eventName, channelName, EventInfo, metadata)
-                    else:
-                        callback(eventName, channelName, EventInfo, metadata)
-
-                if EventInfo and channelName and not metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(eventName, channelName, EventInfo)
-                        self.start_background_task(callback,eventName, channelName, EventInfo)
-                    else:
-                        callback(eventName, channelName, EventInfo)
-
-                if EventInfo and not channelName and metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(eventName, EventInfo, metadata)
-                        self.start_background_task(callback,eventName, EventInfo, metadata)
-                    else:
-                        callback(eventName, EventInfo, metadata)
-
-                if EventInfo and not channelName and not metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(eventName, EventInfo)
-                        self.start_background_task(callback,eventName, EventInfo)
-                    else:
-                        callback(eventName, EventInfo)
-
-                if not EventInfo and not channelName and not metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(eventName)
-                        self.start_background_task(callback,eventName)
-                    else:
-                        callback(eventName)
-
-                if not EventInfo and channelName and not metadata:
-                    if asyncio.iscoroutinefunction(callback):
-                        #await callback(eventName, channelName)
-                        self.start_background_task(callback,eventName, channelName)
-                    else:
-                        callback(eventName, channelName)
+        plans = self.__local_register.get(eventName)
+        if plans:
+            await self.__invoke(plans, args)
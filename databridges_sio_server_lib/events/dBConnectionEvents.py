@@ -24,7 +24,7 @@ from enum import Enum
 connectionEvent = ["connect_error", "connected", "disconnected",
                     "reconnecting", "connecting", "state_change",
                     "reconnect_error", "reconnect_failed", "reconnected",
-                    "connection_break", "rttpong"]
+                    "connection_break", "rttpong", "resubscribe_complete", "rttstall"]
 
 
 class states(Enum):
@@ -39,5 +39,8 @@ class states(Enum):
     RECONNECTED = "reconnected"
     CONNECTION_BREAK = "connection_break"
 
+    RESUBSCRIBE_COMPLETE = "resubscribe_complete"
+    RTTSTALL = "rttstall"
+
     RTTPONG = "rttpong"
     RTTPING = "rttping"
@@ -103,5 +103,9 @@ errorLookup = {
     "E110": [32, 39],
     "E111": [32, 10],
     "E112": [33, 39],
-    "E113": [33, 10]
+    "E113": [33, 10],
+    "E114": [6, 33],
+    "E115": [25, 38],
+    "E116": [21, 38],
+    "E117": [11, 38]
 }
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+from operator import itemgetter
+
+
+class frame(tuple):
+    __slots__ = ()
+
+    def __new__(cls, dbmsgtype, subject=None, rsub=None, sid=None, payload=None, fenceid=None, rspend=None,
+                rtrack=None, rtrackstat=None, t1=None, latency=None, globmatch=0, sourceid=None, sourceip=None,
+                replylatency=None, oqueumonitorid=None):
+        return tuple.__new__(cls, (dbmsgtype, subject, rsub, sid, payload, fenceid, rspend, rtrack, rtrackstat,
+                                   t1, latency, globmatch, sourceid, sourceip, replylatency, oqueumonitorid))
+
+    dbmsgtype = property(itemgetter(0))
+    subject = property(itemgetter(1))
+    rsub = property(itemgetter(2))
+    sid = property(itemgetter(3))
+    payload = property(itemgetter(4))
+    fenceid = property(itemgetter(5))
+    rspend = property(itemgetter(6))
+    rtrack = property(itemgetter(7))
+    rtrackstat = property(itemgetter(8))
+    t1 = property(itemgetter(9))
+    latency = property(itemgetter(10))
+    globmatch = property(itemgetter(11))
+    sourceid = property(itemgetter(12))
+    sourceip = property(itemgetter(13))
+    replylatency = property(itemgetter(14))
+    oqueumonitorid = property(itemgetter(15))
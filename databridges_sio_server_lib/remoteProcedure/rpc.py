@@ -20,10 +20,9 @@
 """
 
 from datetime import datetime
-import re
 import time
 from ..messageTypes import dBTypes
-from ..commonUtils import util
+from ..commonUtils import eventMetadata, util, nameCache
 from ..dispatchers import dispatcher
 from ..exceptions import dBError
 from ..remoteProcedure import rpcState
@@ -36,12 +35,11 @@ from ..events import dBEvents
 class CRpc():
     def __init__(self, dBCoreObject):
         self.__server_type = ["pvt", "prs", "sys"]
+        self.__names = nameCache.NameCache(self.__server_type)
         self.__serverSid_registry = dict()
         self.__serverName_sid = dict()
         self.__dbcore = dBCoreObject
-        self.__dispatch = dispatcher.dispatcher()
-        self.__metadata = {"servername": None, "eventname": None, "sourcesysid": None,
-                           "sqnum": None, "sessionid": None, "intime": None}
+        self.__dispatch = dispatcher.dispatcher(dBCoreObject)
         self.__callersid_object = dict()
 
     def isEmptyOrSpaces(self, str):
@@ -61,31 +59,30 @@ class CRpc():
             else:
                 raise dBError.dBError("E044")
 
-        if self.isEmptyOrSpaces(serverName):
+        error = self.__names.parse(serverName)[0]
+        if error == nameCache.EMPTY:
             if error_type == 1:
                 raise dBError.dBError("E052")
             else:
                 raise dBError.dBError("E045")
 
-        if len(serverName) > 64:
+        if error == nameCache.TOO_LONG:
             if error_type == 1:
                 raise dBError.dBError("E051")
             else:
                 raise dBError.dBError("E045")
 
-        if not re.match('^[a-zA-Z0-9\.:_-]*$', serverName):
+        if error == nameCache.INVALID:
             if error_type == 1:
                 raise dBError.dBError("E052")
             else:
                 raise dBError.dBError("E045")
 
-        if ":" in serverName:
-            sdata = serverName.lower().split(":")
-            if sdata[0] not in self.__server_type:
-                if error_type == 1:
-                    raise dBError.dBError("E052")
-                else:
-                    raise dBError.dBError("E046")
+        if error == nameCache.BAD_PREFIX:
+            if error_type == 1:
+                raise dBError.dBError("E052")
+            else:
+                raise dBError.dBError("E046")
 
     def issidExists(self, sid):
         if sid in self.__serverSid_registry.keys():
@@ -107,12 +104,7 @@ class CRpc():
         self.__dispatch.unbind_all(callback)
 
     def isPrivateServer(self, serverName):
-        flag = False
-        if ":" in serverName:
-            sdata = serverName.lower().split(":")
-            if sdata[0] in self.__server_type:
-                flag = True
-        return flag
+        return bool(self.__names.parse(serverName)[1])
 
     async def communicateR(self, mtype, serverName, sid, access_token):
         cStatus = False
@@ -136,23 +128,26 @@ class CRpc():
             "status"] == rpcState.states.REGISTRATION_INITIATED:
             try:
                 await self.communicateR(0, m_object["name"], sid, access_token)
+                return True
             except dBError.dBError as error:
                 await self._handleRegisterEvents([dBEvents.systemEvents.REGISTRATION_FAIL, dBEvents.systemEvents.SERVER_OFFLINE],
                                            error, m_object)
-                return
+                return False
 
         if m_object["status"] == rpcState.states.RPC_CONNECTION_ACCEPTED or m_object[
             "status"] == rpcState.states.RPC_CONNECTION_INITIATED:
             try:
                 await self.communicateR(1, m_object["name"], sid, access_token)
+                return True
             except dBError.dBError as error:
                 await self._handleRegisterEvents([dBEvents.systemEvents.RPC_CONNECT_FAIL], error, m_object)
-                return
+                return False
+        return False
 
-    async def ReSubscribeAll(self):
-        for (k, v) in self.__serverName_sid.items():
-            for(k2, v2) in v.items():
-                await self._ReSubscribe(k2)
+    async def ReSubscribeAll(self, concurrency=0):
+        sids = [k2 for v in self.__serverName_sid.values() for k2 in v]
+        results = await util.RunBounded(self._ReSubscribe, sids, concurrency)
+        return [sid for sid, sent in zip(sids, results) if sent is True]
 
     async def handledispatcherEvents(self, eventName, eventInfo=None, serverName=None, metadata=None):
         try:
@@ -173,7 +168,9 @@ class CRpc():
 
         if serverName in self.__serverName_sid.keys():
             raise dBError.dBError("E043")
-        sid = util.GenerateUniqueId()
+        sid = self.__dbcore.sidAllocator.acquire()
+        if sid is None:
+            raise dBError.dBError("E115")
         myrpcserver = rpcServer.Crpcserver(serverName, sid, self.__dbcore)
         if serverName not in self.__serverName_sid.keys():
             self.__serverName_sid[serverName] = dict()
@@ -191,11 +188,8 @@ class CRpc():
 
     async def _handleRegisterEvents(self, eventNames, eventData, m_object):
         for eventName in eventNames:
-            tmatadata = self.__metadata.copy()
-            tmatadata["servername"] = m_object["ino"].getServerName()
-            tmatadata["eventname"] = eventName.value
-            tmatadata["sessionid"] =  self.__dbcore.sessionid
-            tmatadata["intime"] = round(time.time())
+            tmatadata = eventMetadata.ServerMetadata(m_object["ino"].getServerName(), eventName.value,
+                                                     sessionid=self.__dbcore.sessionid, intime=round(time.time()))
             await self.__dispatch.emit_channel(eventName, eventData, tmatadata)
             await m_object["ino"].emit_channel(eventName, eventData, tmatadata)
 
@@ -231,6 +225,7 @@ class CRpc():
                             if len(self.__serverName_sid[m_object["name"]].keys()) == 0:
                                 del self.__serverName_sid[m_object["name"]]
                         del self.__serverSid_registry[sid]
+                        self.__dbcore.sidAllocator.release(sid)
         if m_object["type"] == "c":
             if status == rpcState.states.RPC_CONNECTION_ACCEPTED:
                 self.__serverSid_registry[sid]["status"] = status
@@ -247,6 +242,7 @@ class CRpc():
                         del self.__serverName_sid[m_object["name"]]
 
                 del self.__serverSid_registry[sid]
+                self.__dbcore.sidAllocator.release(sid)
 
     async def _updateRegistrationStatusRepeat(self, sid, status, reason):
         if sid not in self.__serverSid_registry:
@@ -268,6 +264,7 @@ class CRpc():
                         del self.__serverName_sid[m_object["name"]]
 
                 del self.__serverSid_registry[sid]
+                self.__dbcore.sidAllocator.release(sid)
         if m_object["type"] == "c":
             if status == rpcState.states.RPC_CONNECTION_ACCEPTED:
                 self.__serverSid_registry[sid]["status"] = status
@@ -283,6 +280,7 @@ class CRpc():
                         del self.__serverName_sid[m_object["name"]]
 
                 del self.__serverSid_registry[sid]
+                self.__dbcore.sidAllocator.release(sid)
 
     async def updateRegistrationStatusAddChange(self, life_cycle, sid, status, reason):
         if life_cycle == 0:
@@ -314,10 +312,13 @@ class CRpc():
         except dBError.dBError as dberror:
             raise dberror
 
-        sid = util.GenerateUniqueId()
+        sid = self.__dbcore.sidAllocator.acquire()
+        if sid is None:
+            raise dBError.dBError("E116")
         cStatus = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.CONNECT_TO_RPC_SERVER,
                                           serverName, sid, None)
         if not cStatus:
+            self.__dbcore.sidAllocator.release(sid)
             raise dBError.dBError("E053")
 
         rpccaller = rpcClient.CrpCaller(serverName, self.__dbcore, self)
@@ -336,12 +337,14 @@ class CRpc():
     def ChannelCall(self, serverName):
         if serverName in self.__serverName_sid:
             sids = self.__serverName_sid[serverName]
-            sid = sids.keys()[0]
+            sid = next(iter(sids))
             mobject = self.__serverSid_registry[sid]
-            self.__serverSid_registry[sid]["count"] = mobject["count"] + 1
-            return mobject
+            self.__serverSid_registry[sid]["count"] = mobject.get("count", 0) + 1
+            return mobject["ino"]
         else:
-            sid = util.GenerateUniqueId()
+            sid = self.__dbcore.sidAllocator.acquire()
+            if sid is None:
+                raise dBError.dBError("E109")
             rpccaller = rpcClient.CrpCaller(serverName, self.__dbcore, self, "ch")
             if serverName not in self.__serverName_sid.keys():
                 self.__serverName_sid[serverName] = dict()
@@ -360,7 +363,7 @@ class CRpc():
         self.__callersid_object[sid] = rpccaller
 
     def delete_object(self, sid):
-        del self.__callersid_object[sid]
+        self.__callersid_object.pop(sid, None)
 
     def get_object(self, sid):
         if sid in self.__callersid_object.keys():
@@ -401,6 +404,7 @@ class CRpc():
                     excludeflag = self.clean_registry(k2)
                     if excludeflag:
                         del self.__serverSid_registry[k2]
+                        self.__dbcore.sidAllocator.release(k2)
                 del self.__serverName_sid[k]
         except Exception as e:
             pass
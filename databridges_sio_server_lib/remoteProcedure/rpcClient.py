@@ -21,25 +21,26 @@
 
 import asyncio
 import json
-import random
+import time
 
 from ..dispatchers import dispatcher
 
-from ..commonUtils import util, aioTimer
+from ..commonUtils import util
 from ..messageTypes import  dBTypes
 from ..responseHandler import  cfrpcResponse
 from ..exceptions import  dBError
-from ..commonUtils import aioPromise
+from ..commonUtils import aioPromise, aioStream
 
 
 class CrpCaller:
     def __init__(self, serverName, dBCoreObject, rpccoreobject, callertype="rpc"):
-        self.__dispatch = dispatcher.dispatcher()
+        self.__dispatch = dispatcher.dispatcher(dBCoreObject)
         self.__dbcore = dBCoreObject
         self.__rpccore = rpccoreobject
         self.enable = False
         self.functions = None
         self.__sid_functionname = {}
+        self.__sid_pending = {}
         self.__serverName = serverName
         self.__isOnline = False
         self.__callerTYPE = callertype
@@ -68,8 +69,48 @@ class CrpCaller:
         await self.__dispatch.emit_clientfunction(functionName, payload, response)
 
     async def handle_callResponse(self, sid, payload, isend, rsub):
-        if sid in self.__sid_functionname.keys():
-            await self.__dispatch.emit_clientfunction2(sid, payload, isend, rsub)
+        if sid not in self.__sid_pending:
+            return
+
+        if not isend:
+            progress_callback = self.__sid_pending[sid]["progress"]
+            if progress_callback and callable(progress_callback):
+                if asyncio.iscoroutinefunction(progress_callback):
+                    await progress_callback(payload)
+                else:
+                    progress_callback(payload)
+            return
+
+        dberror = None
+        if rsub is not None:
+            ursub = str(rsub).upper()
+            if ursub == "EXP":
+                eobject = json.loads(payload)
+                if self.__callerTYPE == 'rpc':
+                    dberror = dBError.dBError("E055")
+                else:
+                    dberror = dBError.dBError("E041")
+                dberror.updateCode(eobject["c"], eobject["m"])
+            else:
+                if self.__callerTYPE == 'rpc':
+                    dberror = dBError.dBError("E054")
+                else:
+                    dberror = dBError.dBError("E040")
+                dberror.updateCode(ursub, "")
+        self.__complete_call(sid, payload, dberror)
+
+    def __complete_call(self, sid, result, dberror=None):
+        if sid not in self.__sid_pending:
+            return
+        call_result = self.__sid_pending.pop(sid)["future"]
+        if sid in self.__sid_functionname:
+            del self.__sid_functionname[sid]
+        if call_result.done():
+            return
+        if dberror is not None:
+            call_result.set_exception(dberror)
+        else:
+            call_result.set_result(result)
 
     async def handle_tracker_dispatcher(self, responseid, errorcode):
         await self.__dispatch.emit_clientfunction('rpc.response.tracker', responseid, errorcode)
@@ -79,141 +120,78 @@ class CrpCaller:
         err.updatecode("CALLEE_QUEUE_EXCEEDED")
         await self.__dispatch.emit_clientfunction('rpc.callee.queue.exceeded', err, None)
 
-    def GetUniqueSid(self, sid):
-        nsid = sid + util.GenerateUniqueId();
-        if nsid in self.__sid_functionname:
-            nsid = ("" + str(random.randint(0, 999999)))
-        return nsid
-
     async def __call_internal(self, sessionid , functionName ,  inparameter, sid, progress_callback):
-        async def internal_call(resolve,reject):
-            internal_result =  False
-
-            cstatus = None;
-            if self.__callerTYPE == 'rpc':
-                cstatus = await util.updatedBNewtworkCF(self.__dbcore, dBTypes.messageType.CALL_RPC_FUNCTION, sessionid, functionName , None , sid ,  inparameter,None, None )
-
-            else:
-                cstatus =  await util.updatedBNewtworkCF(self.__dbcore , dBTypes.messageType.CALL_CHANNEL_RPC_FUNCTION, sessionid, functionName , None , sid ,  inparameter,None, None );
-
-            if not cstatus:
-                if self.__callerTYPE == 'rpc':
-                    reject( dBError.dBError("E079"))
-                else:
-                    reject(dBError.dBError("E033"))
-
-            async def internal_response(response , rspend, rsub):
-                nonlocal internal_result
-                dberror = None
-                if not rspend:
-                    if progress_callback and callable(progress_callback):
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback(response)
-                        else:
-                            progress_callback(response);
-                else:
-                    if rsub is not None:
-                        ursub =  str(rsub).upper()
-                        if ursub == "EXP":
-                            eobject = json.loads(response)
-                            if self.__callerTYPE == 'rpc':
-                                dberror = dBError.dBError("E055")
-                                dberror.updateCode(eobject["c"], eobject["m"] )
-                                reject(dberror)
-                                internal_result = True
-                            else:
-                                dberror = dBError.dBError("E041");
-                                dberror.updateCode(eobject["c"], eobject["m"] );
-                                reject(dberror)
-                                internal_result = True
-                        else:
-                            if self.__callerTYPE == 'rpc':
-                                dberror = dBError.dBError("E054")
-                                dberror.updateCode(ursub, "" )
-                                reject(dberror)
-                            else:
-                                dberror = dBError.dBError("E040")
-                                dberror.updateCode(ursub , "")
-                                reject(dberror)
-                                internal_result = True
-                    else:
-                        resolve(response)
-                        internal_result =  True
-
-                    self.unbind(sid,None);
-                    del self.__sid_functionname[sid]
-            self.bind(sid ,  internal_response)
-            while not internal_result:
-                await asyncio.sleep(1)
-
-        p = aioPromise.Promise()
-        await p.Execute(internal_call)
-        return p
+        call_result = asyncio.get_event_loop().create_future()
+        self.__sid_pending[sid] = {"future": call_result, "progress": progress_callback}
 
+        cstatus = None;
+        if self.__callerTYPE == 'rpc':
+            cstatus = await util.updatedBNewtworkCF(self.__dbcore, dBTypes.messageType.CALL_RPC_FUNCTION, sessionid, functionName , None , sid ,  inparameter,None, None )
 
+        else:
+            cstatus =  await util.updatedBNewtworkCF(self.__dbcore , dBTypes.messageType.CALL_CHANNEL_RPC_FUNCTION, sessionid, functionName , None , sid ,  inparameter,None, None );
 
-    async def call(self, functionName ,  inparameter ,  ttlms , progress_callback):
-        loop_index = 0
-        loop_counter = 3
-        mflag = False
-        sid_created = True
-
-        sid = util.GenerateUniqueId()
-        while loop_index < loop_counter and not mflag:
-            if sid in self.__sid_functionname:
-                sid = self.GetUniqueSid(sid)
-                loop_index = loop_index + 1
+        if not cstatus:
+            if self.__callerTYPE == 'rpc':
+                self.__complete_call(sid, None, dBError.dBError("E079"))
             else:
-                self.__sid_functionname[sid] = functionName
-                mflag = True
+                self.__complete_call(sid, None, dBError.dBError("E033"))
 
-        if not mflag:
-            sid = ("" + str(random.randint(0, 999999)))
-            if not sid in self.__sid_functionname:
-                self.__sid_functionname[sid] = functionName
-            else:
-                sid_created = False
+        return await call_result
 
-        if not sid_created:
+    async def __call(self, functionName ,  inparameter ,  ttlms , progress_callback):
+        sid = self.__dbcore.sidAllocator.acquire()
+        if sid is None:
             if self.__callerTYPE == 'rpc':
                 raise dBError.dBError("E108")
             else:
                 raise dBError.dBError("E109")
-            return
 
+        self.__sid_functionname[sid] = functionName
         self.__rpccore.store_object(sid , self)
-        async def _call(resolve , reject):
-            async def timeexpire():
-                self.unbind(sid);
-                del self.__sid_functionname[sid]
-                if self.__callerTYPE == 'rpc':
-                    reject(dBError.dBError("E080"))
-                else:
-                    reject(dBError.dBError("E042"))
-                await util.updatedBNewtworkCF(
-                    self.__dbcore , dBTypes.messageType.RPC_CALL_TIMEOUT, None,sid,None , None , None , None , None );
 
-            if ttlms < 100:
-                new_ttlms = ttlms / 1000
+        async def timeexpire():
+            self.__dbcore.metrics.labeled_counter("dbridges_call_timeouts_total", "Calls that timed out",
+                                                  "type").inc(self.__callerTYPE)
+            await util.updatedBNewtworkCF(
+                self.__dbcore , dBTypes.messageType.RPC_CALL_TIMEOUT, None,sid,None , None , None , None , None );
+            if self.__callerTYPE == 'rpc':
+                self.__complete_call(sid, None, dBError.dBError("E080"))
             else:
-                new_ttlms = ttlms
-
-            r = aioTimer.Timer(new_ttlms, timeexpire)
-
-            def successResolve(value):
-                r.cancel()
-                resolve(value)
-            def successReject(value):
-                r.cancel()
-                reject(value)
+                self.__complete_call(sid, None, dBError.dBError("E042"))
+
+        if ttlms < 100:
+            new_ttlms = ttlms / 1000
+        else:
+            new_ttlms = ttlms
+
+        r = self.__dbcore.callTimer(new_ttlms, timeexpire)
+        started = time.monotonic()
+        try:
+            return await self.__call_internal(self.__serverName ,functionName , inparameter,sid ,  progress_callback)
+        finally:
+            r.cancel()
+            self.__dbcore.metrics.histogram("dbridges_" + self.__callerTYPE + "_call_seconds",
+                                            "Call latency in seconds").observe(time.monotonic() - started)
+            if sid in self.__sid_pending:
+                del self.__sid_pending[sid]
+            if sid in self.__sid_functionname:
+                del self.__sid_functionname[sid]
+            self.__rpccore.delete_object(sid)
+            self.__dbcore.sidAllocator.release(sid)
 
-            p =await self.__call_internal(self.__serverName ,functionName , inparameter,sid ,  progress_callback)
-            p.then( successResolve).catch( successReject)
+    def call_async(self, functionName ,  inparameter ,  ttlms , progress_callback=None):
+        return asyncio.ensure_future(self.__call(functionName, inparameter, ttlms, progress_callback))
 
+    async def call(self, functionName ,  inparameter ,  ttlms , progress_callback):
         pr = aioPromise.Promise()
-        await pr.Execute(_call)
+        await pr.Wait(self.call_async(functionName, inparameter, ttlms, progress_callback))
         return pr
 
+    def stream(self, functionName, inparameter, ttlms, maxsize=64):
+        responses = aioStream.Stream(maxsize)
+        return responses.start(self.call_async(functionName, inparameter, ttlms, responses.put))
+
     async def emit(self, eventName, eventData, metadata):
         await self.__dispatch.emit_channel(eventName, eventData, metadata)
 
@@ -30,7 +30,7 @@ from ..messageTypes import dBTypes
 
 class Crpcserver:
     def __init__(self, servername, sid, dBCoreObject):
-        self.__dispatch = dispatcher.dispatcher()
+        self.__dispatch = dispatcher.dispatcher(dBCoreObject)
         self.__dbcore = dBCoreObject
         self.__isOnline = False
         self.functions = None
@@ -0,0 +1,66 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+class channelEntry:
+    __slots__ = ("sid", "name", "type", "status", "ino", "isSysAll", "isFenced", "isPresence")
+
+    def __init__(self, sid, name, type, status, ino):
+        lname = str(name).lower()
+        self.sid = sid
+        self.name = name
+        self.type = type
+        self.status = status
+        self.ino = ino
+        self.isSysAll = lname.startswith("sys:*")
+        self.isFenced = lname.startswith("sys::*")
+        self.isPresence = lname.startswith("sys:") or lname.startswith("prs:")
+
+
+class channelRegistry:
+    def __init__(self):
+        self.__sids = {}
+        self.__names = {}
+
+    def __len__(self):
+        return len(self.__sids)
+
+    def add(self, sid, name, type, status, ino):
+        entry = channelEntry(sid, name, type, status, ino)
+        self.__sids[sid] = entry
+        self.__names[name] = entry
+        return entry
+
+    def get(self, sid):
+        return self.__sids.get(sid)
+
+    def find(self, name):
+        return self.__names.get(name)
+
+    def remove(self, sid):
+        entry = self.__sids.pop(sid, None)
+        if entry is not None and self.__names.get(entry.name) is entry:
+            del self.__names[entry.name]
+        return entry
+
+    def entries(self):
+        return list(self.__sids.values())
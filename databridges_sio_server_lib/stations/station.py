@@ -19,17 +19,17 @@
 	limitations under the License.
 """
 
-import re
+import asyncio
 import traceback
 from ..messageTypes import dBTypes
 
-from ..stations import subscribeChannel, channelState
+from ..stations import subscribeChannel, channelState, channelRegistry
 from ..privateAccess import accessResponse
 
 from ..events import dBEvents
 
 
-from ..commonUtils import util, aioPromise
+from ..commonUtils import util, aioPromise, eventMetadata, nameCache
 from ..dispatchers import dispatcher
 from ..exceptions import dBError
 
@@ -37,12 +37,10 @@ from ..exceptions import dBError
 class channels:
     def __init__(self, dBCoreObject):
         self.__channel_type = ["pvt", "prs", "sys"]
-        self.__channelsid_registry = dict()
-        self.__channelname_sid = dict()
+        self.__names = nameCache.NameCache(self.__channel_type)
+        self.__registry = channelRegistry.channelRegistry()
         self.__dbcore = dBCoreObject
-        self.__dispatch = dispatcher.dispatcher()
-        self.__metadata = {"channelname": None, "eventname": None, "sourcesysid": None,
-                           "sqnum": None, "sessionid": None, "intime": None}
+        self.__dispatch = dispatcher.dispatcher(dBCoreObject)
 
     def bind(self, eventName, callback):
         self.__dispatch.bind(eventName, callback)
@@ -59,20 +57,28 @@ class channels:
     async def handledispatcher(self, eventName, eventInfo, metadata=None):
         await self.__dispatch.emit_channel(eventName, eventInfo, metadata)
 
-    async def handledispatcherEvents(self, eventName, eventInfo=None, channelName=None, metadata=None):
-        await self.__dispatch.emit_channel(eventName, eventInfo, metadata)
-        sid = self.__channelname_sid[channelName]
-        m_object = self.__channelsid_registry[sid]
+    async def handledispatcherEvents(self, eventName, eventInfo=None, channelName=None, metadata=None, inline=False):
+        m_object = self.__registry.find(channelName)
+        await self.dispatchEntryEvents(m_object, eventName, eventInfo, metadata, inline)
+
+    def hasListeners(self, m_object, eventName):
+        if self.__dispatch.hasListeners(eventName):
+            return True
+        return m_object.ino.hasListeners(eventName)
+
+    async def dispatchEntryEvents(self, m_object, eventName, eventInfo=None, metadata=None, inline=False,
+                                  droppable=False):
+        await self.__dispatch.emit_channel(eventName, eventInfo, metadata, inline, droppable)
         if m_object:
-            await m_object["ino"].emit_channel(eventName, eventInfo, metadata)
+            await m_object.ino.emit_channel(eventName, eventInfo, metadata, inline, droppable)
 
     def isPrivateChannel(self, channelName):
-        flag = False
-        if ":" in channelName:
-            sdata = channelName.lower().split(":")
-            if sdata[0] in self.__channel_type:
-                flag = True
-        return flag
+        return bool(self.__names.parse(channelName)[1])
+
+    def __isSysAll(self, channelName):
+        if type(channelName) is not str:
+            return str(channelName).lower() == "sys:*"
+        return self.__names.parse(channelName)[2] == "sys:*"
 
     async def communicateR(self, mtype, channelName, sid, access_token):
         cStatus = False
@@ -83,28 +89,30 @@ class channels:
                 raise dBError.dBError("E024")
 
     async def _ReSubscribe(self, sid):
-        m_object = self.__channelsid_registry[sid]
+        m_object = self.__registry.get(sid)
         access_token = None
-        mprivate = self.isPrivateChannel(m_object["name"])
-        if m_object["status"] == channelState.states.SUBSCRIPTION_ACCEPTED or m_object[
-            "status"] == channelState.states.SUBSCRIPTION_INITIATED:
+        if m_object.status == channelState.states.SUBSCRIPTION_ACCEPTED or \
+                m_object.status == channelState.states.SUBSCRIPTION_INITIATED:
             try:
-                await self.communicateR(0, m_object["name"], sid, access_token)
+                await self.communicateR(0, m_object.name, sid, access_token)
+                return True
             except dBError.dBError as error:
                 await self.handleSubscribeEvents([dBEvents.systemEvents.OFFLINE], error, m_object)
-                return
+                return False
 
-        if m_object["status"] == channelState.states.UNSUBSCRIBE_INITIATED:
-            m_object["ino"].set_isOnline(False)
+        if m_object.status == channelState.states.UNSUBSCRIBE_INITIATED:
+            m_object.ino.set_isOnline(False)
             await self.handleSubscribeEvents([dBEvents.systemEvents.UNSUBSCRIBE_SUCCESS, dBEvents.systemEvents.REMOVE], "",
                                        m_object)
-            del self.__channelname_sid[m_object["name"]]
-            del self.__channelsid_registry[sid]
+            self.__registry.remove(sid)
+            self.__dbcore.sidAllocator.release(sid)
+        return False
 
 
-    async def ReSubscribeAll(self):
-        for (k, v) in self.__channelname_sid.items():
-            await self._ReSubscribe(v)
+    async def ReSubscribeAll(self, concurrency=0):
+        sids = [m_object.sid for m_object in self.__registry.entries()]
+        results = await util.RunBounded(self._ReSubscribe, sids, concurrency)
+        return [sid for sid, sent in zip(sids, results) if sent is True]
 
     def isEmptyOrSpaces(self, str):
         if str and str.strip():
@@ -119,6 +127,7 @@ class channels:
             if error_type == 1:
                 raise dBError.dBError("E030")
             if error_type == 2:
+                self.__dbcore.publishFailed()
                 raise dBError.dBError("E014")
             if error_type == 3:
                 raise dBError.dBError("E019")
@@ -137,7 +146,8 @@ class channels:
             if error_type == 4:
                 raise dBError.dBError("E035")
 
-        if self.isEmptyOrSpaces(channelName):
+        error, ctype, lname = self.__names.parse(channelName)
+        if error == nameCache.EMPTY:
             if error_type == 0:
                 raise dBError.dBError("E025")
             if error_type == 1:
@@ -149,7 +159,7 @@ class channels:
             if error_type == 4:
                 raise dBError.dBError("E037")
 
-        if len(channelName) > 64:
+        if error == nameCache.TOO_LONG:
             if error_type == 0:
                 raise dBError.dBError("E027")
             if error_type == 1:
@@ -161,12 +171,7 @@ class channels:
             if error_type == 4:
                 raise dBError.dBError("E036")
 
-        try:
-            matchflag = re.match('^[a-zA-Z0-9\.:_-]*$', channelName)
-        except Exception as e:
-            matchflag = False
-
-        if not matchflag:
+        if error == nameCache.INVALID or error == nameCache.BAD_PREFIX:
             if error_type == 0:
                 raise dBError.dBError("E028")
             if error_type == 1:
@@ -178,19 +183,7 @@ class channels:
             if error_type == 4:
                 raise dBError.dBError("E039")
 
-        if ":" in channelName:
-            sdata = channelName.lower().split(":")
-            if sdata[0] not in self.__channel_type:
-                if error_type == 0:
-                    raise dBError.dBError("E028")
-                if error_type == 1:
-                    raise dBError.dBError("E030")
-                if error_type == 2:
-                    raise dBError.dBError("E015")
-                if error_type == 3:
-                    raise dBError.dBError("E023")
-                if error_type == 4:
-                    raise dBError.dBError("E039")
+        return ctype
 
 
     async def communicate(self, mtype, channelName, mprivate, action):
@@ -198,33 +191,32 @@ class channels:
         m_channel = None
         m_value = None
         access_token = None
-        sid = util.GenerateUniqueId()
+        sid = self.__dbcore.sidAllocator.acquire()
+        if sid is None:
+            raise dBError.dBError("E117")
 
         cStatus = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SERVER_SUBSCRIBE_TO_CHANNEL,
                                               channelName, sid, access_token)
 
 
         if not cStatus:
+            self.__dbcore.sidAllocator.release(sid)
             raise dBError.dBError("E024")
 
         m_channel = subscribeChannel.channel(channelName, sid, self.__dbcore)
-        m_value = {"name": channelName, "type": "s", "status": channelState.states.SUBSCRIPTION_INITIATED,
-                   "ino": m_channel}
-
-        self.__channelsid_registry[sid] = m_value
-        self.__channelname_sid[channelName] = sid
+        self.__registry.add(sid, channelName, "s", channelState.states.SUBSCRIPTION_INITIATED, m_channel)
         return m_channel
 
 
     async def subscribe(self, channelName):
         access_token = None
-        if str(channelName).lower() != "sys:*":
+        if not self.__isSysAll(channelName):
             try:
                 self.validateChanelName(channelName)
             except dBError.dBError as dberror:
                 raise dberror
 
-        if channelName in self.__channelname_sid:
+        if self.__registry.find(channelName) is not None:
             raise dBError.dBError("E029")
 
         mprivate = None
@@ -238,95 +230,93 @@ class channels:
         return m_channel
 
     async def unsubscribe(self, channelName):
-        if channelName not in self.__channelname_sid:
+        m_object = self.__registry.find(channelName)
+        if m_object is None:
             raise dBError.dBError("E030")
 
-        sid = self.__channelname_sid[channelName]
-        m_object = self.__channelsid_registry[sid]
+        sid = m_object.sid
         m_status = False
-        if m_object["type"] != "s":
+        if m_object.type != "s":
             raise dBError.dBError("E030")
 
-        if m_object["status"] == channelState.states.UNSUBSCRIBE_INITIATED:
+        if m_object.status == channelState.states.UNSUBSCRIBE_INITIATED:
             raise dBError.dBError("E031")
 
-        if m_object["status"] == channelState.states.SUBSCRIPTION_ACCEPTED or \
-                m_object["status"] == channelState.states.SUBSCRIPTION_INITIATED or \
-                m_object["status"] == channelState.states.SUBSCRIPTION_PENDING or \
-                m_object["status"] == channelState.states.SUBSCRIPTION_ERROR or \
-                m_object["status"] == channelState.states.UNSUBSCRIBE_ERROR:
+        if m_object.status == channelState.states.SUBSCRIPTION_ACCEPTED or \
+                m_object.status == channelState.states.SUBSCRIPTION_INITIATED or \
+                m_object.status == channelState.states.SUBSCRIPTION_PENDING or \
+                m_object.status == channelState.states.SUBSCRIPTION_ERROR or \
+                m_object.status == channelState.states.UNSUBSCRIBE_ERROR:
             m_status = await util.updatedBNewtworkSC(self.__dbcore,
                                                dBTypes.messageType.SERVER_UNSUBSCRIBE_DISCONNECT_FROM_CHANNEL,
                                                channelName, sid, None)
 
         if not m_status:
             raise dBError.dBError("E032")
-        self.__channelsid_registry[sid]["status"] = channelState.states.UNSUBSCRIBE_INITIATED
+        m_object.status = channelState.states.UNSUBSCRIBE_INITIATED
 
 
     async def handleSubscribeEvents(self, eventNames, eventData, m_object):
         for eventName in eventNames:
-            tmatadata = self.__metadata.copy()
-            tmatadata["channelname"] = m_object["ino"].getChannelName()
-            tmatadata["eventname"] = eventName.value
+            tmatadata = eventMetadata.ChannelMetadata(m_object.ino.getChannelName(), eventName.value)
             await self.__dispatch.emit_channel(eventName, eventData, tmatadata)
-            await m_object["ino"].emit_channel(eventName, eventData, tmatadata)
+            await m_object.ino.emit_channel(eventName, eventData, tmatadata)
 
 
     async def updateSubscribeStatus(self, sid, status, reason):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return
-        m_object = self.__channelsid_registry[sid]
-        if m_object["type"] == "s":
+        if m_object.type == "s":
             if status == channelState.states.SUBSCRIPTION_ACCEPTED:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(True)
+                m_object.status = status
+                m_object.ino.set_isOnline(True)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.SUBSCRIBE_SUCCESS, dBEvents.systemEvents.ONLINE], "",
                                            m_object)
             else:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(False)
+                m_object.status = status
+                m_object.ino.set_isOnline(False)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.SUBSCRIBE_FAIL], reason, m_object)
-                del self.__channelname_sid[m_object["name"]]
-                del self.channelsid_registry[sid]
-        if m_object["type"] == "c":
+                self.__registry.remove(sid)
+                self.__dbcore.sidAllocator.release(sid)
+        if m_object.type == "c":
             if status == channelState.states.CONNECTION_ACCEPTED:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(True)
+                m_object.status = status
+                m_object.ino.set_isOnline(True)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.CONNECT_SUCCESS, dBEvents.systemEvents.ONLINE], "", m_object)
             else:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(False)
+                m_object.status = status
+                m_object.ino.set_isOnline(False)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.CONNECT_FAIL], reason, m_object)
-                del self.__channelname_sid[m_object["name"]]
-                del self.__channelsid_registry[sid]
+                self.__registry.remove(sid)
+                self.__dbcore.sidAllocator.release(sid)
 
     async def updateSubscribeStatusRepeat(self, sid, status, reason):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return
-        m_object = self.__channelsid_registry[sid]
-        if m_object["type"] == "s":
+        if m_object.type == "s":
             if status == channelState.states.SUBSCRIPTION_ACCEPTED:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(True)
+                m_object.status = status
+                m_object.ino.set_isOnline(True)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.RESUBSCRIBE_SUCCESS,  dBEvents.systemEvents.ONLINE], "", m_object)
             else:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(False)
+                m_object.status = status
+                m_object.ino.set_isOnline(False)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.OFFLINE], reason, m_object)
-                del self.__channelname_sid[m_object["name"]]
-                del self.channelsid_registry[sid]
-        if m_object["type"] == "c":
+                self.__registry.remove(sid)
+                self.__dbcore.sidAllocator.release(sid)
+        if m_object.type == "c":
             if status == channelState.states.CONNECTION_ACCEPTED:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(True)
+                m_object.status = status
+                m_object.ino.set_isOnline(True)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.RECONNECT_SUCCESS , dBEvents.systemEvents.ONLINE], "", m_object)
             else:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(False)
+                m_object.status = status
+                m_object.ino.set_isOnline(False)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.OFFLINE], reason, m_object)
-                del self.__channelname_sid[m_object["name"]]
-                del self.channelsid_registry[sid]
+                self.__registry.remove(sid)
+                self.__dbcore.sidAllocator.release(sid)
 
     async def updateChannelsStatusAddChange(self, life_cycle, sid, status, reason):
         if life_cycle == 0:
@@ -335,161 +325,191 @@ class channels:
             await self.updateSubscribeStatusRepeat(sid, status, reason)
 
     async def updateChannelsStatusRemove(self, sid, status, reason):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return
-        m_object = self.__channelsid_registry[sid]
-        if m_object["type"] == "s":
+        if m_object.type == "s":
             if status == channelState.states.UNSUBSCRIBE_ACCEPTED:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(False)
+                m_object.status = status
+                m_object.ino.set_isOnline(False)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.UNSUBSCRIBE_SUCCESS, dBEvents.systemEvents.REMOVE], reason,
                                            m_object)
-                del self.__channelname_sid[m_object["name"]]
-                del self.__channelsid_registry[sid]
+                self.__registry.remove(sid)
+                self.__dbcore.sidAllocator.release(sid)
             else:
-                self.__channelsid_registry[sid]["status"] = channelState.states.SUBSCRIPTION_ACCEPTED
-                m_object["ino"].set_isOnline(True)
+                m_object.status = channelState.states.SUBSCRIPTION_ACCEPTED
+                m_object.ino.set_isOnline(True)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.UNSUBSCRIBE_FAIL, dBEvents.systemEvents.ONLINE], reason,
                                            m_object)
 
-        if m_object["type"] == "c":
+        if m_object.type == "c":
             if status == channelState.states.UNSUBSCRIBE_ACCEPTED:
-                self.__channelsid_registry[sid]["status"] = status
-                m_object["ino"].set_isOnline(False)
+                m_object.status = status
+                m_object.ino.set_isOnline(False)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.DISCONNECT_SUCCESS, dBEvents.systemEvents.REMOVE],
                                            reason, m_object)
-                del self.__channelname_sid[m_object["name"]]
-                del self.channelsid_registry[sid]
+                self.__registry.remove(sid)
+                self.__dbcore.sidAllocator.release(sid)
             else:
-                self.__channelsid_registry[sid]["status"] = channelState.states.SUBSCRIPTION_ACCEPTED
-                m_object["ino"].set_isOnline(True)
+                m_object.status = channelState.states.SUBSCRIPTION_ACCEPTED
+                m_object.ino.set_isOnline(True)
                 await self.handleSubscribeEvents([dBEvents.systemEvents.DISCONNECT_FAIL, dBEvents.systemEvents.ONLINE], reason,
                                            m_object)
 
     def _isonline(self, sid):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return False
-        m_object = self.__channelsid_registry[sid]
-        if m_object["status"] == channelState.states.CONNECTION_ACCEPTED or m_object[
-            "status"] == channelState.states.SUBSCRIPTION_ACCEPTED:
+        if m_object.status == channelState.states.CONNECTION_ACCEPTED or \
+                m_object.status == channelState.states.SUBSCRIPTION_ACCEPTED:
             return True
         return False
 
     def isOnline(self, channelName):
-        if channelName not in self.__channelname_sid:
+        m_object = self.__registry.find(channelName)
+        if m_object is None:
             raise Exception("channel name does not exists")
         if not self.__dbcore.isSocketConnected():
             return False
 
-        sid = self.__channelname_sid[channelName]
-        return self._isonline(sid)
+        return self._isonline(m_object.sid)
 
     def list(self):
         m_data = []
-        for (k, v) in self.__channelsid_registry.items():
+        for m_object in self.__registry.entries():
             i_data = {}
-            i_data["name"] = v["name"]
-            if v["type"] == "s":
+            i_data["name"] = m_object.name
+            if m_object.type == "s":
                 i_data["type"] = "subscribed"
             else:
                 i_data["type"] = "connect"
-            i_data["isonline"] = self._isonline(k)
+            i_data["isonline"] = self._isonline(m_object.sid)
             m_data.append(i_data)
         return m_data
 
     async def send_OfflineEvents(self):
-        for (k, v) in self.__channelsid_registry.items():
-            await self.handleSubscribeEvents([dBEvents.systemEvents.OFFLINE], "", v)
+        for m_object in self.__registry.entries():
+            await self.handleSubscribeEvents([dBEvents.systemEvents.OFFLINE], "", m_object)
+
+    def getEntry(self, sid):
+        return self.__registry.get(sid)
 
     def get_subscribeStatus(self, sid):
-        return self.__channelsid_registry[sid]["status"]
+        return self.__registry.get(sid).status
 
     def get_channelType(self, sid):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return ""
-        return self.__channelsid_registry[sid]["type"]
+        return m_object.type
 
     def get_channelName(self, sid):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return None
-        return self.__channelsid_registry[sid]["name"]
+        return m_object.name
 
     def getConnectStatus(self, sid):
-        return self.__channelsid_registry[sid]["status"]
+        return self.__registry.get(sid).status
 
     def getChannel(self, sid):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return None
-        return self.__channelsid_registry[sid]["ino"]
+        return m_object.ino
 
     def getChannelName(self, sid):
-        if sid not in self.__channelsid_registry:
-            return None
-        return self.__channelsid_registry[sid]["name"]
+        return self.get_channelName(sid)
 
     def isSubscribedChannel(self, sid):
-        if sid not in self.__channelsid_registry:
+        m_object = self.__registry.get(sid)
+        if m_object is None:
             return False
-        if self.__channelsid_registry[sid]["type"] == "s":
-            return self.__channelsid_registry[sid]["ino"].isSubscribed
+        if m_object.type == "s":
+            return m_object.ino.isSubscribed
         else:
             return False
 
-    def __clean_channel(self, sid):
+    def __clean_channel(self, m_object):
         try:
-            if sid not in self.__channelsid_registry:
-                return
-
-            m_object = self.__channelsid_registry[sid]
-            if m_object["type"] == "s":
-                m_object["ino"].set_isOnline(False)
-                m_object["ino"].unbind(None, None)
-                m_object["ino"].unbind_all(None)
+            if m_object.type == "s":
+                m_object.ino.set_isOnline(False)
+                m_object.ino.unbind(None, None)
+                m_object.ino.unbind_all(None)
         except Exception as e:
             pass
 
     async def cleanUp_All(self):
         try:
-            temp_coppied = self.__channelname_sid.copy()
-            for (k, v) in temp_coppied.items():
-                metadata = self.__metadata
-                metadata["channelname"] = k
-                metadata["eventname"] = "dbridges:channel.removed"
-                await self.handledispatcherEvents(dBEvents.systemEvents.REMOVE, "", k, metadata)
-                self.__clean_channel(v)
-                del self.__channelname_sid[k]
-                del self.__channelsid_registry[v]
+            for m_object in self.__registry.entries():
+                metadata = eventMetadata.ChannelMetadata(m_object.name, "dbridges:channel.removed")
+                await self.dispatchEntryEvents(m_object, dBEvents.systemEvents.REMOVE, "", metadata)
+                self.__clean_channel(m_object)
+                self.__registry.remove(m_object.sid)
+                self.__dbcore.sidAllocator.release(m_object.sid)
             #self.__dispatch.unbind(None, None)
             #self.__dispatch.unbind_all(None)
         except Exception as e:
             pass
 
     async def publish(self, channelName, eventName, eventData, exclude_session_id=None , source_id=None, seqnum=None):
+        m_status = await self.__dbcore.send(self.__publishFrame(channelName, eventName, eventData, exclude_session_id,
+                                                                source_id, seqnum))
+        if not m_status:
+            self.__dbcore.publishFailed()
+            raise dBError.dBError("E014")
 
-        if str(channelName).lower() == "sys:*":
+    def __publishFrame(self, channelName, eventName, eventData, exclude_session_id=None, source_id=None, seqnum=None):
+        if self.__isSysAll(channelName):
             raise dBError.dBError("E015")
-        try:
-            self.validateChanelName(channelName ,  2)
-        except dBError.dBError as dberr:
-            raise dberr
+        self.validateChanelName(channelName, 2)
 
         if not eventName:
             raise dBError.dBError("E058")
         if type(eventName) is not str:
             raise dBError.dBError("E059")
 
-        m_status = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SERVER_PUBLISH_TO_CHANNEL,
-                                           channelName, exclude_session_id,
+        return util.NewFrameSC(dBTypes.messageType.SERVER_PUBLISH_TO_CHANNEL, channelName, exclude_session_id,
+                               eventData, eventName, source_id, None, seqnum)
+
+    async def publish_many(self, items):
+        results = [None] * len(items)
+        frames = []
+        positions = []
+        for index, item in enumerate(items):
+            try:
+                if type(item) not in (tuple, list) or not 3 <= len(item) <= 6:
+                    raise dBError.dBError("E114")
+                frames.append(self.__publishFrame(*item))
+                positions.append(index)
+            except dBError.dBError as dberr:
+                results[index] = dberr
+
+        statuses = await self.__dbcore.send_many(frames)
+        for index, m_status in zip(positions, statuses):
+            if m_status:
+                results[index] = True
+            else:
+                self.__dbcore.publishFailed()
+                results[index] = dBError.dBError("E014")
+        return results
+
+
+    async def sendmsg(self, channelName, eventName, eventData, to_session_id, source_id=None, seqnum=None):
+        self.__validateSendmsg(channelName, eventName, source_id)
+
+        m_status = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SERVER_CHANNEL_SENDMSG,
+                                           channelName, to_session_id,
                                            eventData, eventName, source_id, None, seqnum)
         if not m_status:
+            self.__dbcore.publishFailed()
             raise dBError.dBError("E014")
 
-
-    async def sendmsg(self, channelName, eventName, eventData, to_session_id, source_id=None, seqnum=None):
-        if str(channelName).lower() == "sys:*":
+    def __validateSendmsg(self, channelName, eventName, source_id):
+        if self.__isSysAll(channelName):
             raise dBError.dBError("E015")
         try:
-            self.validateChanelName(channelName, 3)
+            ctype = self.validateChanelName(channelName, 3)
         except dBError.dBError as dberr:
             raise dberr
 
@@ -498,43 +518,40 @@ class channels:
         if type(eventName) is not str:
             raise dBError.dBError("E059")
 
-        if str(channelName).lower().startswith("prs:"):
+        if ctype == "prs":
             if not source_id:
                 raise dBError.dBError("E020")
-        m_status = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SERVER_CHANNEL_SENDMSG,
-                                           channelName, to_session_id,
-                                           eventData, eventName, source_id, None, seqnum)
-        if not m_status:
-            raise dBError.dBError("E014")
 
 
-    async def call(self , channelName, functionName ,  payload ,  ttl , callback):
+    async def sendmsg_many(self, channelName, eventName, eventData, to_session_ids, source_id=None, seqnum=None):
+        self.__validateSendmsg(channelName, eventName, source_id)
+        m_status = await util.updatedBNewtworkSCMany(self.__dbcore, dBTypes.messageType.SERVER_CHANNEL_SENDMSG,
+                                                     channelName, to_session_ids,
+                                                     eventData, eventName, source_id, None, seqnum)
+        for sessionid, status in m_status.items():
+            if status:
+                m_status[sessionid] = True
+            else:
+                self.__dbcore.publishFailed()
+                m_status[sessionid] = dBError.dBError("E014")
+        return m_status
 
-        async def _incall(resolve , reject):
-            def successResolve(value):
-                #self.__dbcore.rpc.ClearChannel(channelName)
-                resolve(value)
+    async def __call(self, channelName, functionName, payload, ttl, callback):
+        ctype = self.validateChanelName(channelName, 4)
 
-            def successReject(value):
-                #self.__dbcore.rpc.ClearChannel(channelName)
-                reject(value)
+        if functionName not in ['channelMemberList', 'channelMemberInfo', 'timeout' ,  'err']:
+            raise dBError.dBError("E038")
 
-            try:
-                self.validateChanelName(channelName, 4)
-            except dBError.dBError as dberr:
-                reject(dberr)
-            if functionName not in ['channelMemberList', 'channelMemberInfo', 'timeout' ,  'err']:
-                reject(dBError.dBError("E038"))
-            else:
-                if str(channelName).lower().startswith("prs:") or str(channelName).lower().startswith("sys:"):
-                    caller = self.__dbcore.rpc.ChannelCall(channelName)
-                    p = await caller.call(functionName ,  payload ,  ttl ,  callback)
-                    p.then(successResolve).catch(successReject)
-                else:
-                    reject(dBError.dBError("E039"))
+        if ctype != "prs" and ctype != "sys":
+            raise dBError.dBError("E039")
 
-        pr = aioPromise.Promise()
-        await pr.Execute(_incall)
-        return pr
+        caller = self.__dbcore.rpc.ChannelCall(channelName)
+        return await caller.call_async(functionName ,  payload ,  ttl ,  callback)
 
+    def call_async(self, channelName, functionName, payload, ttl, callback=None):
+        return asyncio.ensure_future(self.__call(channelName, functionName, payload, ttl, callback))
 
+    async def call(self , channelName, functionName ,  payload ,  ttl , callback):
+        pr = aioPromise.Promise()
+        await pr.Wait(self.call_async(channelName, functionName, payload, ttl, callback))
+        return pr
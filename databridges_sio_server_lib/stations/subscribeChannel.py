@@ -19,6 +19,8 @@
 	limitations under the License.
 """
 
+import asyncio
+
 from ..messageTypes import dBTypes
 from ..commonUtils import util, aioPromise
 from ..dispatchers import dispatcher
@@ -28,8 +30,9 @@ from ..exceptions import dBError
 class channel(dispatcher.dispatcher):
 
     def __init__(self, channelName, sid, dBCoreObject):
-        dispatcher.dispatcher.__init__(self)
+        dispatcher.dispatcher.__init__(self, dBCoreObject)
         self.__channelName = channelName
+        self.__lchannelName = str(channelName).lower()
         self.__sid = sid
         self.__dbcore = dBCoreObject
         self.__isOnline = False
@@ -45,9 +48,10 @@ class channel(dispatcher.dispatcher):
 
     async def publish(self, eventName, eventData, seqnum=None):
         if not self.__isOnline:
+            self.__dbcore.publishFailed()
             raise dBError.dBError("E014")
 
-        if str(self.__channelName).lower() == "sys:*":
+        if self.__lchannelName == "sys:*":
             raise dBError.dBError("E015")
 
         if not eventName:
@@ -60,14 +64,22 @@ class channel(dispatcher.dispatcher):
                                            eventData, eventName, None, None, seqnum)
 
         if not m_status:
+            self.__dbcore.publishFailed()
             raise dBError.dBError("E014")
 
     async def publish(self, eventName, eventData, exclude_session_id=None , source_id=None, seqnum=None):
+        m_status = await self.__dbcore.send(self.__publishFrame(eventName, eventData, exclude_session_id, source_id,
+                                                                seqnum))
+        if not m_status:
+            self.__dbcore.publishFailed()
+            raise dBError.dBError("E014")
 
+    def __publishFrame(self, eventName, eventData, exclude_session_id=None, source_id=None, seqnum=None):
         if not self.__isOnline:
+            self.__dbcore.publishFailed()
             raise dBError.dBError("E014")
 
-        if str(self.__channelName).lower() == "sys:*":
+        if self.__lchannelName == "sys:*":
             raise dBError.dBError("E015")
 
         if not eventName:
@@ -76,40 +88,66 @@ class channel(dispatcher.dispatcher):
         if type(eventName) is not str:
             raise dBError.dBError("E059")
 
+        return util.NewFrameSC(dBTypes.messageType.SERVER_PUBLISH_TO_CHANNEL, self.__channelName, exclude_session_id,
+                               eventData, eventName, source_id, None, seqnum)
+
+    async def publish_many(self, events):
+        results = [None] * len(events)
+        frames = []
+        positions = []
+        for index, event in enumerate(events):
+            try:
+                if type(event) not in (tuple, list) or not 2 <= len(event) <= 5:
+                    raise dBError.dBError("E114")
+                frames.append(self.__publishFrame(*event))
+                positions.append(index)
+            except dBError.dBError as dberr:
+                results[index] = dberr
+
+        statuses = await self.__dbcore.send_many(frames)
+        for index, m_status in zip(positions, statuses):
+            if m_status:
+                results[index] = True
+            else:
+                self.__dbcore.publishFailed()
+                results[index] = dBError.dBError("E014")
+        return results
 
-        m_status = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SERVER_PUBLISH_TO_CHANNEL,
-                                           self.__channelName, exclude_session_id,
-                                           eventData, eventName, source_id, None, seqnum)
-        if not m_status:
-            raise dBError.dBError("E014")
 
+    async def __call(self, functionName, payload, ttl, callback):
+        if functionName not in ['channelMemberList', 'channelMemberInfo', 'timeout' ,  'err']:
+            raise dBError.dBError("E038")
 
-    async def call(self , functionName ,  payload ,  ttl , callback):
-        async def _incall(resolve , reject):
-            def successResolve(value):
-                #self.__dbcore.rpc.ClearChannel(self.__channelName)
-                resolve(value)
+        if not (self.__lchannelName.startswith("prs:") or self.__lchannelName.startswith("sys:")):
+            raise dBError.dBError("E039")
 
-            def successReject(value):
-                #self.__dbcore.rpc.ClearChannel(self.__channelName)
-                reject(value)
+        caller = self.__dbcore.rpc.ChannelCall(self.__channelName)
+        return await caller.call_async(functionName ,  payload ,  ttl ,  callback)
 
-            if functionName not in ['channelMemberList', 'channelMemberInfo', 'timeout' ,  'err']:
-                reject(dBError.dBError("E038"))
-            else:
-                if str(self.__channelName).lower().startswith("prs:") or str(self.__channelName).lower().startswith("sys:"):
-                    caller = self.__dbcore.rpc.ChannelCall(self.__channelName)
-                    p =   await caller.call(functionName ,  payload ,  ttl ,  callback)
-                    p.then(successResolve).catch(successReject)
-                else:
-                    reject(dBError.dBError("E039"))
+    def call_async(self, functionName, payload, ttl, callback=None):
+        return asyncio.ensure_future(self.__call(functionName, payload, ttl, callback))
 
+    async def call(self , functionName ,  payload ,  ttl , callback):
         pr = aioPromise.Promise()
-        await pr.Execute(_incall)
+        await pr.Wait(self.call_async(functionName, payload, ttl, callback))
         return pr
 
     async def sendmsg(self, eventName, eventData, to_session_id, source_id=None, seqnum=None):
-        if str(self.__channelName).lower() == "sys:*":
+        self.__validateSendmsg(eventName, source_id)
+        m_status = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SERVER_CHANNEL_SENDMSG,
+                                           self.__channelName, to_session_id,
+                                           eventData, eventName, source_id, None, seqnum)
+        if not m_status:
+            self.__dbcore.publishFailed()
+            raise dBError.dBError("E014")
+
+    async def sendmsg_many(self, eventName, eventData, to_session_ids, source_id=None, seqnum=None):
+        self.__validateSendmsg(eventName, source_id)
+        return await self.__dbcore.channel.sendmsg_many(self.__channelName, eventName, eventData, to_session_ids,
+                                                        source_id, seqnum)
+
+    def __validateSendmsg(self, eventName, source_id):
+        if self.__lchannelName == "sys:*":
             raise dBError.dBError("E019")
 
         if not eventName:
@@ -117,12 +155,7 @@ class channel(dispatcher.dispatcher):
         if type(eventName) is not str:
             raise dBError.dBError("E020")
 
-        if str(self.__channelName).lower().startswith("prs:"):
+        if self.__lchannelName.startswith("prs:"):
             if not source_id:
                 raise dBError.dBError("E020")
-        m_status = await util.updatedBNewtworkSC(self.__dbcore, dBTypes.messageType.SERVER_CHANNEL_SENDMSG,
-                                           self.__channelName, to_session_id,
-                                           eventData, eventName, source_id, None, seqnum)
-        if not m_status:
-            raise dBError.dBError("E014")
 
@@ -0,0 +1,125 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+import asyncio
+import json
+import socket
+from urllib.parse import parse_qs
+
+import socketio
+from aiohttp import web
+
+from databridges_sio_server_lib.messageTypes import dBTypes
+
+
+def frame(dbmsgtype, subject=None, sid=None, payload=None):
+    return (dbmsgtype, subject, None, sid, payload, None, None, None, None, None, None, None, None, None, None, None)
+
+
+def free_port(host="127.0.0.1"):
+    with socket.socket() as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+
+class FlappingServer:
+    def __init__(self, host="127.0.0.1", port=None):
+        self.host = host
+        self.port = port or free_port(host)
+        self.auth_url = "http://%s:%d/auth" % (host, self.port)
+        self.auth_requests = 0
+        self.connects = 0
+        self.sessionkeys = []
+        self.subscribes = []
+        self.subscribe_sids = []
+        self.__clients = set()
+        self.__site = None
+
+        self.__sio = socketio.AsyncServer(async_mode="aiohttp")
+        self.__sio.on("connect", self.__connect)
+        self.__sio.on("disconnect", self.__disconnect)
+        self.__sio.on("db", self.__message)
+        self.__app = web.Application()
+        self.__app.router.add_post("/auth", self.__auth)
+        self.__sio.attach(self.__app)
+        self.__runner = web.AppRunner(self.__app)
+
+    @property
+    def up(self):
+        return self.__site is not None
+
+    async def start(self):
+        if self.__runner.server is None:
+            await self.__runner.setup()
+        self.__site = web.TCPSite(self.__runner, self.host, self.port)
+        await self.__site.start()
+
+    async def drop(self):
+        for sid in list(self.__clients):
+            self.__clients.discard(sid)
+            socket = self.__sio.eio.sockets.pop(sid, None)
+            if socket is not None:
+                await socket.close(wait=False)
+
+    async def stop(self):
+        if self.__site is not None:
+            await self.__site.stop()
+            self.__site = None
+        await self.drop()
+
+    async def flap(self, downtime):
+        await self.stop()
+        await asyncio.sleep(downtime)
+        await self.start()
+
+    async def close(self):
+        await self.stop()
+        await self.__runner.cleanup()
+
+    async def __auth(self, request):
+        self.auth_requests += 1
+        return web.Response(text=json.dumps({"secured": False, "wsip": self.host, "wsport": str(self.port),
+                                             "sessionkey": "session-%d" % self.auth_requests}))
+
+    async def __connect(self, sid, environ):
+        self.connects += 1
+        self.sessionkeys.append(parse_qs(environ.get("QUERY_STRING", "")).get("sessionkey", [None])[0])
+        self.__clients.add(sid)
+        self.__sio.start_background_task(self.__welcome, sid)
+
+    async def __send(self, sid, msg):
+        # AsyncServer.emit(room=...) in python-socketio 3.1 hands coroutines to asyncio.wait,
+        # which Python 3.11 rejects, so frames go straight to the one client.
+        await self.__sio._emit_internal(sid, "db", msg, "/")
+
+    async def __welcome(self, sid):
+        await asyncio.sleep(0)
+        await self.__send(sid, frame(dBTypes.messageType.SYSTEM_MSG.value, "connection:success", None, sid.encode()))
+
+    async def __disconnect(self, sid):
+        self.__clients.discard(sid)
+
+    async def __message(self, sid, *args):
+        if args[0] == dBTypes.messageType.SERVER_SUBSCRIBE_TO_CHANNEL.value:
+            self.subscribes.append(args[5])
+            self.subscribe_sids.append(args[3])
+            await self.__send(sid, frame(dBTypes.messageType.SERVER_SUBSCRIBE_TO_CHANNEL.value, "success", args[3], b""))
@@ -0,0 +1,115 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.commonUtils import aioBatcher
+
+
+def test_flush_writes_each_batch_once():
+    batches = []
+
+    async def writer(frames):
+        batches.append(frames)
+        return [True] * len(frames)
+
+    async def main():
+        batcher = aioBatcher.Batcher(writer, maxsize=4, delay=0.001)
+        for n in range(10):
+            await batcher.put(n)
+        await asyncio.sleep(0.05)
+        return batcher.stats()
+
+    stats = asyncio.run(main())
+    assert [frame for batch in batches for frame in batch] == list(range(10))
+    assert max(len(batch) for batch in batches) <= 4
+    assert stats["flush_count"] == len(batches)
+    assert stats["frames_sent"] == 10
+    assert stats["frames_failed"] == 0
+
+
+def test_writer_errors_are_logged(caplog):
+    async def writer(frames):
+        raise ConnectionError("socket closed")
+
+    async def main():
+        batcher = aioBatcher.Batcher(writer, maxsize=8, delay=0.001)
+        for n in range(3):
+            await batcher.put(n)
+        await asyncio.sleep(0.05)
+        return batcher.stats()
+
+    with caplog.at_level(logging.ERROR, logger=aioBatcher.__name__):
+        stats = asyncio.run(main())
+    assert stats["frames_failed"] == 3
+    assert "socket closed" in caplog.text
+
+
+def test_full_queue_waits_for_flush():
+    written = []
+
+    async def writer(frames):
+        await asyncio.sleep(0.01)
+        written.extend(frames)
+        return [True] * len(frames)
+
+    async def main():
+        batcher = aioBatcher.Batcher(writer, maxsize=2, delay=0.001, maxqueue=2)
+        for n in range(8):
+            await batcher.put(n)
+            assert batcher.queue_depth() <= 2
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+    assert written == list(range(8))
+
+
+def test_put_many_queues_once_and_respects_queue_limit():
+    batches = []
+    depths = []
+
+    async def main():
+        batcher = aioBatcher.Batcher(None, maxsize=2, delay=0.001, maxqueue=3)
+
+        async def writer(frames):
+            depths.append(batcher.queue_depth())
+            await asyncio.sleep(0.005)
+            batches.append(frames)
+            return [True] * len(frames)
+
+        batcher._Batcher__writer = writer
+        await batcher.put_many(list(range(10)))
+        assert batcher.queue_depth() <= 3
+        await asyncio.sleep(0.1)
+        return batcher.stats()
+
+    stats = asyncio.run(main())
+    assert [frame for batch in batches for frame in batch] == list(range(10))
+    assert max(depths) <= 3
+    assert stats["frames_sent"] == 10
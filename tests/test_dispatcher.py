@@ -0,0 +1,58 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.dispatchers import dispatcher
+
+
+def emitted(payload, metadata):
+    received = []
+    dispatch = dispatcher.dispatcher()
+    dispatch.bind("event", lambda *args: received.append(args))
+    dispatch.bind_all(lambda *args: received.append(args))
+    asyncio.run(dispatch.emit_connectionState("event", payload, metadata))
+    return received
+
+
+def test_empty_payload_and_metadata_pass_no_arguments():
+    assert emitted(None, None) == [(), ()]
+    assert emitted("", {}) == [(), ()]
+
+
+def test_metadata_only():
+    assert emitted(None, {"channelname": "a"}) == [(None, {"channelname": "a"})] * 2
+
+
+def test_payload_only():
+    assert emitted("data", None) == [("data",)] * 2
+    assert emitted("data", {}) == [("data",)] * 2
+
+
+def test_payload_and_metadata():
+    assert emitted("data", {"channelname": "a"}) == [("data", {"channelname": "a"})] * 2
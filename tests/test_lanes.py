@@ -0,0 +1,169 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.commonUtils import aioLanes
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_lane_keeps_order_and_lanes_run_concurrently():
+    async def main():
+        lanes = aioLanes.Lanes()
+        seen = []
+        release = asyncio.Event()
+
+        async def work(key, n):
+            if key == "slow" and n == 0:
+                await release.wait()
+            await asyncio.sleep(0)
+            seen.append((key, n))
+
+        for n in range(5):
+            await lanes.submit("slow", work, "slow", n)
+            await lanes.submit("fast", work, "fast", n)
+        await settle()
+        assert [n for key, n in seen if key == "fast"] == list(range(5))
+        assert not [n for key, n in seen if key == "slow"]
+        release.set()
+        await settle()
+        assert [n for key, n in seen if key == "slow"] == list(range(5))
+
+    asyncio.run(main())
+
+
+def test_drained_lanes_are_removed():
+    async def main():
+        lanes = aioLanes.Lanes()
+
+        async def work():
+            await asyncio.sleep(0)
+
+        for key in range(10):
+            await lanes.submit(key, work)
+        assert len(lanes) == 10
+        await settle()
+        assert len(lanes) == 0
+        assert lanes.stats()["queued"] == 0
+        assert lanes._Lanes__tasks == {}
+
+    asyncio.run(main())
+
+
+def test_reject_when_lane_full():
+    async def main():
+        lanes = aioLanes.Lanes(max_pending=1, overflow="reject")
+        release = asyncio.Event()
+        dropped = []
+
+        async def work():
+            await release.wait()
+
+        await lanes.submit("a", work)
+        await settle()
+        assert await lanes.submit("a", work)
+        assert not await lanes.submit("a", work, on_drop=lambda: dropped.append(1))
+        assert await lanes.submit("b", work)
+        assert dropped == [1]
+        assert lanes.stats()["rejected"] == 1
+        release.set()
+        await settle()
+
+    asyncio.run(main())
+
+
+def test_drop_oldest_when_lane_full():
+    async def main():
+        lanes = aioLanes.Lanes(max_pending=2, overflow="drop_oldest")
+        release = asyncio.Event()
+        ran = []
+        dropped = []
+
+        async def work(n):
+            await release.wait()
+            ran.append(n)
+
+        await lanes.submit("a", work, 0)
+        await settle()
+        for n in range(1, 5):
+            await lanes.submit("a", work, n, on_drop=lambda n=n: dropped.append(n))
+        assert dropped == [1, 2]
+        assert lanes.stats()["dropped"] == 2
+        release.set()
+        await settle()
+        assert ran == [0, 3, 4]
+
+    asyncio.run(main())
+
+
+def test_block_waits_for_lane_space():
+    async def main():
+        lanes = aioLanes.Lanes(max_pending=1)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        await lanes.submit("a", work)
+        await settle()
+        await lanes.submit("a", work)
+        blocked = asyncio.ensure_future(lanes.submit("a", work))
+        await settle()
+        assert not blocked.done()
+        release.set()
+        assert await asyncio.wait_for(blocked, 1)
+        await settle()
+        assert len(lanes) == 0
+
+    asyncio.run(main())
+
+
+def test_failing_task_is_logged_and_lane_continues(caplog):
+    async def main():
+        lanes = aioLanes.Lanes()
+        seen = []
+
+        async def broken():
+            raise ValueError("lane task broke")
+
+        async def work():
+            seen.append(True)
+
+        await lanes.submit("a", broken)
+        await lanes.submit("a", work)
+        await settle()
+        return seen
+
+    with caplog.at_level(logging.ERROR, logger=aioLanes.__name__):
+        assert asyncio.run(main()) == [True]
+    assert "lane task broke" in caplog.text
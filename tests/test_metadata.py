@@ -0,0 +1,83 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import copy
+import json
+import pickle
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.commonUtils import eventMetadata
+
+
+def metadata():
+    return eventMetadata.ChannelMetadata("pvt:a", "ev", "src", 7, "session", 1234)
+
+
+def test_reads_like_a_dict():
+    m = metadata()
+    assert isinstance(m, dict)
+    assert m["channelname"] == "pvt:a"
+    assert m.get("intime") == 1234
+    assert list(m) == ["channelname", "eventname", "sourcesysid", "sqnum", "sessionid", "intime"]
+    assert eventMetadata.ServerMetadata("srv")["servername"] == "srv"
+
+
+@pytest.mark.parametrize("write", [
+    lambda m: m.__setitem__("eventname", "x"),
+    lambda m: m.__delitem__("eventname"),
+    lambda m: m.update(eventname="x"),
+    lambda m: m.pop("eventname"),
+    lambda m: m.popitem(),
+    lambda m: m.clear(),
+    lambda m: m.setdefault("extra", 1),
+    lambda m: m.__ior__({"eventname": "x"}),
+])
+def test_writes_raise(write):
+    m = metadata()
+    with pytest.raises(TypeError):
+        write(m)
+    assert m == metadata()
+
+
+def test_copy_is_writable_dict():
+    m = metadata()
+    writable = m.copy()
+    assert type(writable) is dict
+    writable["eventname"] = "changed"
+    assert m["eventname"] == "ev"
+
+
+def test_json_serializable():
+    assert json.loads(json.dumps(metadata())) == dict(metadata())
+
+
+def test_pickle_and_deepcopy_stay_read_only():
+    for clone in (pickle.loads(pickle.dumps(metadata())), copy.deepcopy(metadata()), copy.copy(metadata())):
+        assert type(clone) is eventMetadata.Metadata
+        assert clone == metadata()
+        with pytest.raises(TypeError):
+            clone["eventname"] = "x"
@@ -0,0 +1,65 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.commonUtils import util
+
+
+def test_encode_str_and_none():
+    assert util.EncodePayload("héllo") == "héllo".encode()
+    assert util.EncodePayload(None) == b""
+
+
+def test_encode_bytes_without_copy():
+    payload = b"\x00\xff" * 1024
+    assert util.EncodePayload(payload) is payload
+    assert util.EncodePayload(memoryview(payload)) is payload
+
+
+def test_encode_bytearray_and_partial_memoryview():
+    assert util.EncodePayload(bytearray(b"abc")) == b"abc"
+    assert type(util.EncodePayload(bytearray(b"abc"))) is bytes
+    assert util.EncodePayload(memoryview(b"abcdef")[1:3]) == b"bc"
+    assert util.EncodePayload(memoryview(bytearray(b"xyz"))) == b"xyz"
+
+
+def test_decode_text():
+    assert util.DecodePayload("héllo".encode()) == "héllo"
+    assert util.DecodePayload(memoryview(b"abc")) == "abc"
+    assert util.DecodePayload(b"") == ""
+    assert util.DecodePayload(None) == ""
+
+
+def test_decode_invalid_utf8_keeps_bytes():
+    assert util.DecodePayload(b"\xff\xfe") == b"\xff\xfe"
+
+
+def test_decode_binary():
+    payload = b"\xff\xfe"
+    assert util.DecodePayload(payload, True) is payload
+    assert util.DecodePayload(b"abc", True) == b"abc"
+    assert util.DecodePayload(None, True) == b""
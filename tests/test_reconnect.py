@@ -0,0 +1,127 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+import sioserver
+from databridges_sio_server_lib import dBridges
+
+
+async def until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        await asyncio.sleep(0.01)
+
+
+def client(server, events):
+    db = dBridges()
+    db.auth_url = server.auth_url
+    db.appkey = "appkey"
+    db.appsecret = "appsecret"
+    db.minReconnectionDelay = 0.25
+    db.reconnectionDelayGrowFactor = 1
+    db.reconnectionJitter = 0
+    db.minUptime = 1
+    for name in ("connected", "reconnected", "connection_break", "reconnecting", "reconnect_error", "disconnected",
+                 "resubscribe_complete"):
+        db.connectionstate.bind(name, lambda *args, name=name: events.append(name))
+    return db
+
+
+async def flapping(flaps, downtime):
+    server = sioserver.FlappingServer()
+    await server.start()
+    events = []
+    db = client(server, events)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.ensure_future(ticker())
+    connecting = asyncio.ensure_future(db.connect())
+    try:
+        await until(lambda: "connected" in events)
+        await db.channel.subscribe("flap")
+        await until(lambda: server.subscribes == ["flap"])
+
+        for flap in range(flaps):
+            await server.stop()
+            await until(lambda: "connection_break" in events[-3:])
+            down = len(ticks)
+            await asyncio.sleep(downtime)
+            gaps = [b - a for a, b in zip(ticks[down:], ticks[down + 1:])]
+            assert max(gaps) < db.minReconnectionDelay
+            await server.start()
+            await until(lambda: events.count("reconnected") == flap + 1)
+            assert server.subscribes == ["flap"] * (flap + 2)
+
+        assert server.connects == flaps + 1
+        assert len(set(server.sessionkeys)) == server.connects
+        assert events.count("connected") == 1
+        assert events.count("resubscribe_complete") == flaps
+        assert "reconnect_error" in events
+        assert len(set(server.subscribe_sids)) == 1
+        assert db.sidAllocator.isInUse(server.subscribe_sids[0])
+        assert db.sidAllocator.in_use() == 1
+    finally:
+        await db.disconnect()
+        await until(lambda: "disconnected" in events)
+        ticking.cancel()
+        connecting.cancel()
+        await server.close()
+
+
+def test_reconnects_while_server_flaps():
+    asyncio.run(flapping(3, 0.6))
+
+
+def test_drop_without_downtime_reconnects():
+    async def main():
+        server = sioserver.FlappingServer()
+        await server.start()
+        events = []
+        db = client(server, events)
+        connecting = asyncio.ensure_future(db.connect())
+        try:
+            await until(lambda: "connected" in events)
+            await server.drop()
+            await until(lambda: "reconnected" in events)
+            assert events.count("connection_break") == 1
+            assert server.connects == 2
+            assert len(set(server.sessionkeys)) == 2
+        finally:
+            await db.disconnect()
+            connecting.cancel()
+            await server.close()
+
+    asyncio.run(main())
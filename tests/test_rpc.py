@@ -0,0 +1,45 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib import dBridges
+
+
+def test_channel_call_reuses_caller():
+    db = dBridges()
+    first = db.rpc.ChannelCall("sys:*")
+    second = db.rpc.ChannelCall("sys:*")
+    assert first is second
+    registry = db.rpc._CRpc__serverSid_registry
+    assert len(registry) == 1
+    assert next(iter(registry.values()))["count"] == 2
+
+
+def test_channel_call_per_server():
+    db = dBridges()
+    assert db.rpc.ChannelCall("prs:a") is not db.rpc.ChannelCall("prs:b")
+    assert len(db.rpc._CRpc__serverSid_registry) == 2
@@ -0,0 +1,71 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib import dBridges
+
+
+def client():
+    db = dBridges()
+    sent = []
+
+    async def send(frame):
+        sent.append(frame)
+        return True
+
+    db.send = send
+    return db, sent
+
+
+def test_pong_matches_ping_in_send_order():
+    async def main():
+        db, sent = client()
+        state = db.connectionstate
+        await state.rttping()
+        await state.rttping()
+        t1 = sent[0][9]
+        assert type(t1) is int
+        state.rttpong(t1)
+        assert type(state.rttms) is int
+        assert state.rttstats()["count"] == 1
+        state.rttpong(t1)
+        assert state.rttstats()["count"] == 2
+
+    asyncio.run(main())
+
+
+def test_unmatched_pong_is_left_out_of_stats():
+    db, sent = client()
+    state = db.connectionstate
+    rtt = state.rttpong(round(time.time()) - 2)
+    assert rtt >= 1
+    assert state.rttms == round(rtt * 1000)
+    assert state.rttstats() == {"count": 0, "last": None, "min": None, "max": None,
+                                "p50": None, "p95": None, "p99": None}
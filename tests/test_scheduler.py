@@ -0,0 +1,166 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.commonUtils import aioScheduler
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_concurrency_limit_runs_in_submit_order():
+    async def main():
+        scheduler = aioScheduler.TaskScheduler(max_concurrency=2)
+        release = asyncio.Event()
+        started = []
+
+        async def work(n):
+            started.append(n)
+            await release.wait()
+
+        for n in range(5):
+            assert await scheduler.submit(work, n)
+        await settle()
+        assert started == [0, 1]
+        assert scheduler.stats()["running"] == 2
+        assert scheduler.queued() == 3
+        release.set()
+        await settle()
+        assert started == [0, 1, 2, 3, 4]
+        assert scheduler.stats()["completed"] == 5
+
+    asyncio.run(main())
+
+
+def test_reject_only_droppable_work():
+    async def main():
+        scheduler = aioScheduler.TaskScheduler(max_concurrency=1, max_queue=1, overflow="reject")
+        release = asyncio.Event()
+        dropped = []
+
+        async def work():
+            await release.wait()
+
+        await scheduler.submit(work)
+        await scheduler.submit(work)
+        assert not await scheduler.submit(work, droppable=True, on_drop=lambda: dropped.append(1))
+        assert await scheduler.submit(work)
+        assert dropped == [1]
+        assert scheduler.stats()["rejected"] == 1
+        assert scheduler.queued() == 2
+        release.set()
+        await settle()
+
+    asyncio.run(main())
+
+
+def test_drop_oldest_evicts_droppable_work():
+    async def main():
+        scheduler = aioScheduler.TaskScheduler(max_concurrency=1, max_queue=2, overflow="drop_oldest")
+        release = asyncio.Event()
+        ran = []
+        dropped = []
+
+        async def work(n):
+            ran.append(n)
+            await release.wait()
+
+        await scheduler.submit(work, 0)
+        await scheduler.submit(work, 1)
+        await scheduler.submit(work, 2, droppable=True, on_drop=lambda: dropped.append(2))
+        assert await scheduler.submit(work, 3, droppable=True, on_drop=lambda: dropped.append(3))
+        assert await scheduler.submit(work, 4, droppable=True, on_drop=lambda: dropped.append(4))
+        assert dropped == [2, 3]
+        assert scheduler.stats()["dropped"] == 2
+        release.set()
+        await settle()
+        assert ran == [0, 1, 4]
+
+    asyncio.run(main())
+
+
+def test_drop_oldest_keeps_required_work():
+    async def main():
+        scheduler = aioScheduler.TaskScheduler(max_concurrency=1, max_queue=1, overflow="drop_oldest")
+        release = asyncio.Event()
+        dropped = []
+
+        async def work():
+            await release.wait()
+
+        await scheduler.submit(work)
+        await scheduler.submit(work)
+        assert not await scheduler.submit(work, droppable=True, on_drop=lambda: dropped.append(1))
+        assert dropped == [1]
+        assert scheduler.queued() == 1
+        release.set()
+        await settle()
+
+    asyncio.run(main())
+
+
+def test_block_waits_for_queue_space():
+    async def main():
+        scheduler = aioScheduler.TaskScheduler(max_concurrency=1, max_queue=1)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        await scheduler.submit(work)
+        await scheduler.submit(work)
+        blocked = asyncio.ensure_future(scheduler.submit(work))
+        await settle()
+        assert not blocked.done()
+        release.set()
+        assert await asyncio.wait_for(blocked, 1)
+        await settle()
+        assert scheduler.stats()["completed"] == 3
+
+    asyncio.run(main())
+
+
+def test_failing_work_is_logged(caplog):
+    async def main():
+        scheduler = aioScheduler.TaskScheduler()
+
+        async def broken():
+            raise ValueError("handler broke")
+
+        await scheduler.submit(broken)
+        await settle()
+        return scheduler.stats()
+
+    with caplog.at_level(logging.ERROR, logger=aioScheduler.__name__):
+        stats = asyncio.run(main())
+    assert stats["completed"] == 1
+    assert "handler broke" in caplog.text
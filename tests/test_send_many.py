@@ -0,0 +1,154 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib import dBridges
+from databridges_sio_server_lib.commonUtils import util
+from databridges_sio_server_lib.messageTypes import dBTypes
+
+
+class Socket:
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.emitted = []
+        self.yields = 0
+
+    async def emit(self, event, msgDbp):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if msgDbp[3] == "bad":
+            raise ConnectionError("broken pipe")
+        self.emitted.append(msgDbp[3])
+
+
+def client(socket, batching=False, queue_limit=10000):
+    db = dBridges()
+    db.outboundBatching = batching
+    db.outboundBatchSize = 2
+    db.outboundBatchDelay = 0.001
+    db.outboundQueueLimit = queue_limit
+    db._dBridges__ClientSocket = socket
+    return db
+
+
+def frames(sids):
+    return [util.NewFrameSC(dBTypes.messageType.SERVER_CHANNEL_SENDMSG, "chan", sid, "x", "ev") for sid in sids]
+
+
+def test_send_many_without_batching_writes_in_one_pass():
+    async def main():
+        socket = Socket()
+        db = client(socket)
+        loop_ran = []
+        asyncio.get_event_loop().call_soon(loop_ran.append, True)
+        results = await db.send_many(frames(["a", "bad", "c"]))
+        return socket, results, list(loop_ran)
+
+    socket, results, loop_ran = asyncio.run(main())
+    assert results == [True, False, True]
+    assert socket.emitted == ["a", "c"]
+    assert loop_ran == []
+
+
+def test_send_many_with_batching_applies_backpressure():
+    async def main():
+        socket = Socket(delay=0.002)
+        db = client(socket, batching=True, queue_limit=3)
+        depths = []
+
+        async def watch():
+            while True:
+                depths.append(db.outboundStats()["queue_depth"])
+                await asyncio.sleep(0)
+
+        watching = asyncio.ensure_future(watch())
+        results = await db.send_many(frames([str(n) for n in range(12)]))
+        await asyncio.sleep(0.1)
+        watching.cancel()
+        return socket, results, depths, db.outboundStats()
+
+    socket, results, depths, stats = asyncio.run(main())
+    assert results == [True] * 12
+    assert socket.emitted == [str(n) for n in range(12)]
+    assert max(depths) <= 3
+    assert stats["frames_sent"] == 12
+
+
+def test_sendmsg_many_maps_each_session_id():
+    async def main():
+        socket = Socket()
+        db = client(socket)
+        db.connectionstate.isconnected = True
+        results = await db.channel.sendmsg_many("pvt:chan", "ev", "x", ["a", "bad", "a", "c"])
+        return socket, results
+
+    socket, results = asyncio.run(main())
+    assert list(results) == ["a", "bad", "c"]
+    assert results["a"] is True and results["c"] is True
+    assert results["bad"].code == "NETWORK_DISCONNECTED"
+    assert socket.emitted == ["a", "c"]
+
+
+def test_sendmsg_many_waits_for_batch_space():
+    async def main():
+        socket = Socket(delay=0.002)
+        db = client(socket, batching=True, queue_limit=4)
+        db.connectionstate.isconnected = True
+        depths = []
+
+        async def watch():
+            while True:
+                depths.append(db.outboundStats()["queue_depth"])
+                await asyncio.sleep(0)
+
+        watching = asyncio.ensure_future(watch())
+        sessionids = [str(n) for n in range(20)]
+        results = await db.channel.sendmsg_many("pvt:chan", "ev", "x", sessionids)
+        assert db.outboundStats()["queue_depth"] <= 4
+        await asyncio.sleep(0.1)
+        watching.cancel()
+        return socket, results, depths
+
+    socket, results, depths = asyncio.run(main())
+    assert all(result is True for result in results.values())
+    assert socket.emitted == [str(n) for n in range(20)]
+    assert max(depths) <= 4
+
+
+def test_sendmsg_keeps_single_session_id():
+    async def main():
+        socket = Socket()
+        db = client(socket)
+        db.connectionstate.isconnected = True
+        result = await db.channel.sendmsg("pvt:chan", "ev", "x", 12345)
+        return socket, result
+
+    socket, result = asyncio.run(main())
+    assert result is None
+    assert socket.emitted == [12345]
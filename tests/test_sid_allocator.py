@@ -0,0 +1,92 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib import dBridges
+from databridges_sio_server_lib.commonUtils import sidAllocator
+from databridges_sio_server_lib.exceptions import dBError
+
+
+def test_acquire_is_unique():
+    allocator = sidAllocator.SidAllocator()
+    sids = [allocator.acquire() for _ in range(1000)]
+    assert len(set(sids)) == 1000
+    assert allocator.in_use() == 1000
+
+
+def test_release_and_reuse_after_wrap():
+    allocator = sidAllocator.SidAllocator(1, 3)
+    assert [allocator.acquire() for _ in range(3)] == ["1", "2", "3"]
+    allocator.release("2")
+    assert not allocator.isInUse("2")
+    assert allocator.acquire() == "2"
+    assert allocator.in_use() == 3
+
+
+def test_wrap_skips_ids_in_use():
+    allocator = sidAllocator.SidAllocator(1, 3)
+    first = allocator.acquire()
+    allocator.release(allocator.acquire())
+    allocator.release(allocator.acquire())
+    assert allocator.acquire() != first
+    assert allocator.acquire() != first
+
+
+def test_exhaustion_returns_none():
+    allocator = sidAllocator.SidAllocator(1, 2)
+    allocator.acquire()
+    allocator.acquire()
+    assert allocator.acquire() is None
+    allocator.release("1")
+    assert allocator.acquire() == "1"
+
+
+def exhausted():
+    db = dBridges()
+    db.connectionstate.isconnected = True
+    db.sidAllocator = sidAllocator.SidAllocator(1, 1)
+    db.sidAllocator.acquire()
+    return db
+
+
+def error_source(call):
+    with pytest.raises(dBError.dBError) as info:
+        call()
+    assert info.value.code == "ID_GENERATION_FAILED"
+    return info.value.source
+
+
+def test_exhausted_registrations_raise():
+    db = exhausted()
+    assert error_source(lambda: db.rpc.init("server1")) == "DBLIB_RPC_INIT"
+    assert error_source(lambda: db.rpc.ChannelCall("sys:*")) == "DBLIB_CHANNEL_CALL"
+    assert error_source(lambda: asyncio.run(db.rpc.connect("server1"))) == "DBLIB_RPC_CONNECT"
+    assert error_source(lambda: asyncio.run(db.channel.communicate(None, "chan1", False, None))) == \
+        "DBLIB_CHANNEL_SUBSCRIBE"
+    assert db.sidAllocator.in_use() == 1
@@ -0,0 +1,81 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.commonUtils import aioStream
+
+
+async def producers(maxsize, count, chunks):
+    done = asyncio.Event()
+
+    async def call():
+        await done.wait()
+        return "end"
+
+    stream = aioStream.Stream(maxsize).start(asyncio.ensure_future(call()))
+
+    async def produce(n):
+        for i in range(chunks):
+            await stream.put((n, i))
+
+    tasks = [asyncio.ensure_future(produce(n)) for n in range(count)]
+    await asyncio.sleep(0)
+    received = []
+    async for item in stream:
+        if item == "end":
+            break
+        received.append(item)
+        await asyncio.sleep(0)
+        if len(received) == count * chunks:
+            done.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), 5)
+    return received
+
+
+def test_concurrent_puts_keep_arrival_order():
+    received = asyncio.run(asyncio.wait_for(producers(2, 5, 1), 5))
+    assert received == [(n, 0) for n in range(5)]
+
+
+def test_concurrent_puts_lose_nothing():
+    received = asyncio.run(asyncio.wait_for(producers(3, 4, 50), 5))
+    assert sorted(received) == [(n, i) for n in range(4) for i in range(50)]
+    for n in range(4):
+        assert [i for m, i in received if m == n] == list(range(50))
+
+
+def test_aclose_releases_waiting_puts():
+    async def main():
+        stream = aioStream.Stream(1).start(asyncio.ensure_future(asyncio.sleep(10)))
+        tasks = [asyncio.ensure_future(stream.put(n)) for n in range(4)]
+        await asyncio.sleep(0)
+        await stream.aclose()
+        await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+	Databridges Python server Library
+	https://www.databridges.io/
+
+
+
+	Copyright 2022 Optomate Technologies Private Limited.
+
+	Licensed under the Apache License, Version 2.0 (the "License");
+	you may not use this file except in compliance with the License.
+	You may obtain a copy of the License at
+
+	    http://www.apache.org/licenses/LICENSE-2.0
+
+	Unless required by applicable law or agreed to in writing, software
+	distributed under the License is distributed on an "AS IS" BASIS,
+	WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+	See the License for the specific language governing permissions and
+	limitations under the License.
+"""
+
+
+
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip("socketio")
+pytest.importorskip("aiohttp")
+
+from databridges_sio_server_lib.commonUtils import aioTimer
+
+
+def test_wheel_fires_in_deadline_order():
+    async def main():
+        wheel = aioTimer.TimerWheel(resolution=0.005, slots=8)
+        fired = []
+        for delay in (0.06, 0.01, 0.03):
+            wheel.schedule(delay, lambda delay=delay: fired.append(delay))
+        assert len(wheel) == 3
+        await asyncio.sleep(0.15)
+        assert len(wheel) == 0
+        return fired
+
+    assert asyncio.run(main()) == [0.01, 0.03, 0.06]
+
+
+def test_wheel_does_not_fire_early():
+    async def main():
+        loop = asyncio.get_event_loop()
+        wheel = aioTimer.TimerWheel(resolution=0.01, slots=4)
+        started = loop.time()
+        fired = asyncio.Event()
+        elapsed = []
+
+        def expire():
+            elapsed.append(loop.time() - started)
+            fired.set()
+
+        wheel.schedule(0.1, expire)
+        await asyncio.wait_for(fired.wait(), 1)
+        return elapsed[0]
+
+    assert asyncio.run(main()) >= 0.1 - 0.01
+
+
+def test_cancel_removes_timer():
+    async def main():
+        wheel = aioTimer.TimerWheel(resolution=0.005)
+        fired = []
+        handle = wheel.schedule(0.02, lambda: fired.append("cancelled"))
+        wheel.schedule(0.03, lambda: fired.append("kept"))
+        handle.cancel()
+        handle.cancel()
+        assert len(wheel) == 1
+        await asyncio.sleep(0.08)
+        return fired
+
+    assert asyncio.run(main()) == ["kept"]
+
+
+def test_coroutine_callback():
+    async def main():
+        wheel = aioTimer.TimerWheel(resolution=0.005)
+        fired = asyncio.Event()
+
+        async def expire():
+            fired.set()
+
+        wheel.schedule(0.01, expire)
+        await asyncio.wait_for(fired.wait(), 1)
+
+    asyncio.run(main())
+
+
+def test_failing_callbacks_are_logged(caplog):
+    async def main():
+        wheel = aioTimer.TimerWheel(resolution=0.005)
+        fired = []
+
+        def broken():
+            raise ValueError("sync timer broke")
+
+        async def broken_async():
+            raise ValueError("async timer broke")
+
+        wheel.schedule(0.01, broken)
+        wheel.schedule(0.01, broken_async)
+        wheel.schedule(0.02, lambda: fired.append(True))
+        await asyncio.sleep(0.06)
+        return fired
+
+    with caplog.at_level(logging.ERROR, logger=aioTimer.__name__):
+        assert asyncio.run(main()) == [True]
+    assert "sync timer broke" in caplog.text
+    assert "async timer broke" in caplog.text